@@ -1,4 +1,7 @@
+import mmap
+import os
 from collections import deque
+from math import factorial, isqrt
 
 class PuzzleState:
     def __init__(self, board, parent=None, move="", depth=0):
@@ -44,27 +47,262 @@ class PuzzleState:
         print()
 
 
-def bfs(start, goal):
-    start_state = PuzzleState(start)
-    if start == goal:
-        return start_state.path()
+# ----------------- Packed states -----------------
+# A board is packed into one int: tile at cell i in bits 4i..4i+3, and the
+# blank's index in bits 36..39 so it never has to be searched for.
+BLANK_SHIFT = 36
 
+# For each blank index, the (move, new blank index) pairs that stay on the board
+NEIGHBORS = [
+    [(move, r * 3 + c) for move, (r, c) in (("Up", (row - 1, col)), ("Down", (row + 1, col)),
+                                             ("Left", (row, col - 1)), ("Right", (row, col + 1)))
+     if 0 <= r < 3 and 0 <= c < 3]
+    for row, col in (divmod(blank, 3) for blank in range(9))
+]
+MOVE_NAMES = {-3: "Up", 3: "Down", -1: "Left", 1: "Right"}
+
+
+def pack(board):
+    state = board.index(0) << BLANK_SHIFT
+    for i, tile in enumerate(board):
+        state |= tile << (4 * i)
+    return state
+
+
+def unpack(state):
+    return [(state >> (4 * i)) & 0xF for i in range(9)]
+
+
+def packed_moves(state):
+    """Yield (move, child) for each blank slide from a packed state"""
+    blank = state >> BLANK_SHIFT
+    for move, new_blank in NEIGHBORS[blank]:
+        # The blank is tile 0, so sliding a tile is one subtract and one add
+        tile = (state >> (4 * new_blank)) & 0xF
+        yield move, (state - (tile << (4 * new_blank)) + (tile << (4 * blank))
+                     + ((new_blank - blank) << BLANK_SHIFT))
+
+
+def chain(parents, state):
+    """States from state back to the root of a parent dict"""
+    states = [state]
+    while parents[state] != state:
+        state = parents[state]
+        states.append(state)
+    return states
+
+
+def states_path(states):
+    """Turn a list of packed states into the path() format"""
+    p = [("", unpack(states[0]))]
+    for prev, cur in zip(states, states[1:]):
+        p.append((MOVE_NAMES[(cur >> BLANK_SHIFT) - (prev >> BLANK_SHIFT)], unpack(cur)))
+    return p
+
+
+def packed_path(parents, state):
+    """Rebuild the path() format from a dict mapping each state to its parent"""
+    return states_path(chain(parents, state)[::-1])
+
+
+def inversions(board):
+    tiles = [t for t in board if t != 0]
+    return sum(1 for i in range(len(tiles)) for j in range(i + 1, len(tiles)) if tiles[i] > tiles[j])
+
+
+def is_solvable(start, goal):
+    """Whether start can reach goal on a square board of any size.
+
+    On an odd-width board every move keeps the inversion parity. On an even
+    width a vertical move flips it and also moves the blank one row, so the
+    parity of inversions plus blank row is kept instead. Start and goal
+    must match, or a search would exhaust half the state space (or, when
+    deepening, never stop).
+    """
+    size = isqrt(len(start))
+
+    def parity(board):
+        p = inversions(board)
+        if size % 2 == 0:
+            p += board.index(0) // size
+        return p % 2
+    return parity(start) == parity(goal)
+
+
+def bfs(start, goal, bidirectional=False, stats=None):
+    """Breadth-first search from start to goal.
+
+    With bidirectional=True both ends are searched at once (see
+    bidirectional_bfs). If a stats dict is given, the number of nodes
+    expanded from each end is stored in it.
+    """
+    if not is_solvable(start, goal):
+        if stats is not None:
+            stats.update(forward_expanded=0, backward_expanded=0)
+        return None
+    if bidirectional:
+        return bidirectional_bfs(start, goal, stats)
+
+    start_state, goal_state = pack(start), pack(goal)
+
+    # parents doubles as the visited set; the start is its own parent
+    parents = {start_state: start_state}
     queue = deque([start_state])
-    visited = set()
-    visited.add(tuple(start))
+    expanded = 0
 
     while queue:
         current = queue.popleft()
 
-        if current.board == goal:
-            return current.path()
+        if current == goal_state:
+            break
 
-        for neighbor in current.get_moves():
-            t_board = tuple(neighbor.board)
-            if t_board not in visited:
-                visited.add(t_board)
+        expanded += 1
+        for _, neighbor in packed_moves(current):
+            if neighbor not in parents:
+                parents[neighbor] = current
                 queue.append(neighbor)
-    return None
+    else:
+        current = None
+
+    if stats is not None:
+        stats.update(forward_expanded=expanded, backward_expanded=0)
+    return packed_path(parents, current) if current is not None else None
+
+
+def expand_layer(frontier, parents, other):
+    """Expand one full BFS layer; returns (next layer, meeting state or None).
+
+    Of all children already reached by the other search, the one closest to
+    the other end is kept, so the spliced path is a shortest one.
+    """
+    next_frontier = []
+    meet, meet_depth = None, None
+    for state in frontier:
+        for _, neighbor in packed_moves(state):
+            if neighbor in parents:
+                continue
+            parents[neighbor] = state
+            next_frontier.append(neighbor)
+            if neighbor in other:
+                depth = len(chain(other, neighbor))
+                if meet is None or depth < meet_depth:
+                    meet, meet_depth = neighbor, depth
+    return next_frontier, meet
+
+
+def bidirectional_bfs(start, goal, stats=None):
+    """BFS from start and goal at once, always growing the smaller frontier.
+
+    The two searches meet in the middle after about b^(d/2) nodes each
+    instead of b^d, and the halves are spliced into the usual path() format.
+    """
+    start_state, goal_state = pack(start), pack(goal)
+    forward = {start_state: start_state}
+    backward = {goal_state: goal_state}
+    forward_frontier, backward_frontier = [start_state], [goal_state]
+    forward_expanded = backward_expanded = 0
+    meet = start_state if start_state == goal_state else None
+
+    while meet is None and forward_frontier and backward_frontier:
+        if len(forward_frontier) <= len(backward_frontier):
+            forward_expanded += len(forward_frontier)
+            forward_frontier, meet = expand_layer(forward_frontier, forward, backward)
+        else:
+            backward_expanded += len(backward_frontier)
+            backward_frontier, meet = expand_layer(backward_frontier, backward, forward)
+
+    if stats is not None:
+        stats.update(forward_expanded=forward_expanded, backward_expanded=backward_expanded)
+    if meet is None:
+        return None
+    return states_path(chain(forward, meet)[::-1] + chain(backward, meet)[1:])
+
+
+# ----------------- Distance table -----------------
+# One byte per permutation of the 9 tiles, indexed by permutation rank,
+# holding the exact number of moves to the goal (UNREACHABLE for the other
+# parity class). Built once by BFS backwards from the goal, then memory-mapped.
+UNREACHABLE = 255
+FACTORIALS = [factorial(i) for i in range(9)]
+
+
+def rank(board):
+    """Lehmer-code index of a permutation of 0..8, in range(9!)"""
+    r = 0
+    for i in range(9):
+        smaller = 0
+        for j in range(i + 1, 9):
+            if board[j] < board[i]:
+                smaller += 1
+        r += smaller * FACTORIALS[8 - i]
+    return r
+
+
+def table_file(goal):
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        "8puzzle_" + "".join(map(str, goal)) + ".dist")
+
+
+def build_distance_table(goal, filename=None):
+    """Retrograde BFS from goal over every reachable state; writes the table"""
+    table = bytearray([UNREACHABLE]) * factorial(9)
+    goal_state = pack(goal)
+    table[rank(goal)] = 0
+    queue = deque([goal_state])
+    while queue:
+        current = queue.popleft()
+        distance = table[rank(unpack(current))] + 1
+        for _, neighbor in packed_moves(current):
+            r = rank(unpack(neighbor))
+            if table[r] == UNREACHABLE:
+                table[r] = distance
+                queue.append(neighbor)
+    write_table(filename or table_file(goal), table)
+
+
+def write_table(filename, data):
+    """Write under a temporary name and rename into place, so a crash or a
+    concurrent build never leaves a short table where a loader expects one"""
+    temporary = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, filename)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def load_distance_table(goal, filename=None):
+    """Memory-map the distance table for goal, building it on first use"""
+    filename = filename or table_file(goal)
+    if not os.path.exists(filename):
+        build_distance_table(goal, filename)
+    with open(filename, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def table_solve(start, goal, table=None):
+    """Optimal solution by walking downhill in the distance table.
+
+    Each step takes the neighbor one move closer to the goal, so a solution
+    of depth d costs O(d) table lookups and no search at all.
+    """
+    if table is None:
+        table = load_distance_table(goal)
+    state = pack(start)
+    distance = table[rank(start)]
+    if distance == UNREACHABLE:
+        return None
+    states = [state]
+    while distance > 0:
+        for _, neighbor in packed_moves(state):
+            if table[rank(unpack(neighbor))] == distance - 1:
+                state = neighbor
+                break
+        states.append(state)
+        distance -= 1
+    return states_path(states)
 
 
 if __name__ == "__main__":
@@ -91,3 +329,10 @@ if __name__ == "__main__":
             print()
     else:
         print("No solution found.")
+
+    stats = {}
+    solution = bfs(initial_state, goal_state, bidirectional=True, stats=stats)
+    if solution:
+        print(f"Bidirectional BFS: {len(solution)-1} moves, "
+              f"{stats['forward_expanded']} nodes expanded forward, "
+              f"{stats['backward_expanded']} backward")
@@ -1,76 +1,192 @@
+import math
+import time
 from collections import deque
 
+from Lab_2 import is_solvable
+from Lab_5a import (conflict_moves, goal_positions, linear_conflict, manhattan_distance, manhattan_table,
+                    misplaced_tiles)
+
 GOAL_STATE = (1, 2, 3, 4, 5, 6, 7, 8, 0)
 
-MOVES = {
-    'up': -3,
-    'down': 3,
-    'left': -1,
-    'right': 1
-}
-
-def is_valid_move(blank_idx, move):
-    if move == 'left' and blank_idx % 3 == 0:
-        return False
-    if move == 'right' and blank_idx % 3 == 2:
-        return False
-    if move == 'up' and blank_idx < 3:
-        return False
-    if move == 'down' and blank_idx > 5:
-        return False
-    return True
-
-def get_successors(state):
-    successors = []
-    blank_idx = state.index(0)
-    
-    for move in MOVES:
-        if is_valid_move(blank_idx, move):
-            swap_idx = blank_idx + MOVES[move]
-            new_state = list(state)
-            new_state[blank_idx], new_state[swap_idx] = new_state[swap_idx], new_state[blank_idx]
-            successors.append(tuple(new_state))
-    return successors
-
-def DLS(state, goal, limit, path, visited, last_state_holder):
-    last_state_holder[0] = state
-    
-    if state == goal:
-        return path
-    if limit == 0:
-        return None
-    
-    visited.add(state)
-    
-    for successor in get_successors(state):
-        if successor not in visited:
-            result = DLS(successor, goal, limit - 1, path + [successor], visited, last_state_holder)
-            if result is not None:
-                return result
-    
-    visited.remove(state)
-    return None
+# Cells the blank can swap with, for each blank index, per board size
+ADJACENT_BY_SIZE = {}
 
-def IDDFS(start, goal):
+def adjacent_cells(size):
+    if size not in ADJACENT_BY_SIZE:
+        adjacent = []
+        for blank_idx in range(size * size):
+            r, c = divmod(blank_idx, size)
+            adjacent.append([nr * size + nc for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                             if 0 <= nr < size and 0 <= nc < size])
+        ADJACENT_BY_SIZE[size] = adjacent
+    return ADJACENT_BY_SIZE[size]
+
+def replay(start, blanks, depth):
+    # Rebuild the states along a path from the blank positions stored for it
+    board = list(start)
+    states = [tuple(board)]
+    for d in range(1, depth + 1):
+        board[blanks[d - 1]], board[blanks[d]] = board[blanks[d]], 0
+        states.append(tuple(board))
+    return states
+
+class BoardView:
+    # Gives the in-place board the .board attribute the Lab_5a heuristics read
+    __slots__ = ("board",)
+
+    def __init__(self, board):
+        self.board = board
+
+def bind_heuristic(heuristic, goal, board):
+    # h() for the board DLS changes in place, with the goal's lookup tables
+    # resolved once per search instead of at every node
+    goal = tuple(goal)
+    if heuristic is manhattan_distance or heuristic is linear_conflict:
+        table = manhattan_table(goal)
+        if heuristic is manhattan_distance:
+            return lambda: sum(table[tile][i] for i, tile in enumerate(board))
+        positions = goal_positions(goal)
+        size = math.isqrt(len(goal))
+        return lambda: (sum(table[tile][i] for i, tile in enumerate(board))
+                        + conflict_moves(board, positions, size))
+    view = BoardView(board)
+    return lambda: heuristic(view, goal)
+
+def DLS(start, goal, limit, last_state_holder, heuristic=None, stats=None):
+    # Depth-limited DFS without recursion: one board is changed in place and
+    # the path is only the blank position per depth, on preallocated stacks.
+    # Instead of a visited set, the move that undoes the previous one is skipped.
+    #
+    # With a heuristic, limit bounds f = g + h instead of depth (IDA*). A stats
+    # dict receives the nodes generated and expanded, the deepest point of the
+    # stack, and the smallest f over the bound (the next iteration's bound).
+    board = list(start)
+    goal = list(goal)
+    h = bind_heuristic(heuristic, goal, board) if heuristic is not None else None
+    nodes = 0
+    expanded = 0
+    peak_depth = 0
+    next_limit = None
+    result = None
+    blanks = [0] * (limit + 1)   # blank position at each depth of the path
+    choice = [0] * (limit + 1)   # next entry of adjacent to try at each depth
+    adjacent = adjacent_cells(math.isqrt(len(board)))
+    blanks[0] = board.index(0)
     depth = 0
+    last_depth = 0
+
+    if board == goal:
+        result = [tuple(start)]
+
+    while result is None:
+        blank = blanks[depth]
+        moves = adjacent[blank]
+        i = choice[depth]
+        if depth == limit or i == len(moves):
+            if depth == 0:
+                break
+            # Unmove: slide the tile back from where the blank came from
+            prev = blanks[depth - 1]
+            board[blank], board[prev] = board[prev], 0
+            depth -= 1
+            continue
+        if i == 0:
+            expanded += 1
+        choice[depth] = i + 1
+        target = moves[i]
+        if depth > 0 and target == blanks[depth - 1]:
+            continue
+        board[blank], board[target] = board[target], 0
+        nodes += 1
+        if h is not None:
+            f = depth + 1 + h()
+            if f > limit:
+                if next_limit is None or f < next_limit:
+                    next_limit = f
+                board[target], board[blank] = board[blank], 0
+                continue
+        depth += 1
+        blanks[depth] = target
+        choice[depth] = 0
+        last_depth = depth
+        if depth > peak_depth:
+            peak_depth = depth
+        if board == goal:
+            result = replay(start, blanks, depth)
+
+    if stats is not None:
+        stats.update(nodes_generated=nodes, nodes_expanded=expanded,
+                     peak_depth=peak_depth, next_limit=next_limit)
+    if result is None:
+        # blanks still holds the last path walked, so the last state is
+        # replayed once here rather than copied at every node
+        last_state_holder[0] = replay(start, blanks, last_depth)[-1]
+    else:
+        last_state_holder[0] = result[-1]
+    return result
+
+def search_iterations(start, goal, heuristic=None):
+    # Run the deepening iterations, yielding (record, path, last visited
+    # state) after each one; path is None until the goal is found. Without a
+    # heuristic the limit grows by one (IDDFS), with one it jumps to the
+    # smallest f that was cut off (IDA*). Nothing is printed.
+    if not is_solvable(start, goal):
+        return
+    if heuristic is None:
+        limit = 0
+    else:
+        limit = heuristic(BoardView(list(start)), list(goal))
     iteration = 1
     while True:
-        visited = set()
+        stats = {}
         last_state_holder = [start]
-        path = DLS(start, goal, depth, [start], visited, last_state_holder)
-        
-        print(f"Iteration {iteration} completed at Depth limit = {depth}")
-        print("Last visited puzzle state in this iteration:")
-        print_puzzle(last_state_holder[0])
-        
+        began = time.perf_counter()
+        path = DLS(start, goal, limit, last_state_holder, heuristic, stats)
+        record = {
+            "iteration": iteration,
+            "limit": limit,
+            "nodes_generated": stats["nodes_generated"],
+            "nodes_expanded": stats["nodes_expanded"],
+            "time": time.perf_counter() - began,
+            "peak_depth": stats["peak_depth"],
+        }
+        yield record, path, last_state_holder[0]
         if path is not None:
-            return path
-        depth += 1
+            return
+        limit = limit + 1 if heuristic is None else stats["next_limit"]
         iteration += 1
 
+def IDDFS(start, goal, quiet=False, on_iteration=None):
+    # on_iteration, if given, is called with each iteration's stats record;
+    # quiet=True skips the progress printout
+    for record, path, last_state in search_iterations(start, goal):
+        if on_iteration is not None:
+            on_iteration(record)
+        if not quiet:
+            print(f"Iteration {record['iteration']} completed at Depth limit = {record['limit']}")
+            print("Last visited puzzle state in this iteration:")
+            print_puzzle(last_state)
+        if path is not None:
+            return path
+    return None
+
+def IDA_star(start, goal, heuristic=manhattan_distance, quiet=False, on_iteration=None):
+    # Same depth-first skeleton as IDDFS, but each iteration is bounded by
+    # f = g + h and the next bound is the smallest f that was cut off
+    for record, path, _ in search_iterations(start, goal, heuristic):
+        if on_iteration is not None:
+            on_iteration(record)
+        if not quiet:
+            print(f"Iteration {record['iteration']} completed at f-bound = {record['limit']}, "
+                  f"nodes generated = {record['nodes_generated']}")
+        if path is not None:
+            return path
+    return None
+
 def print_puzzle(state):
-    for i in range(0, 9, 3):
-        print(state[i:i+3])
+    size = math.isqrt(len(state))
+    for i in range(0, len(state), size):
+        print(state[i:i+size])
     print()
 
 if __name__ == "__main__":
@@ -83,6 +199,15 @@ if __name__ == "__main__":
     
     solution_path = IDDFS(start_state, GOAL_STATE)
     
-    print(f"Solution found in {len(solution_path) - 1} moves:")
-    for step in solution_path:
-        print_puzzle(step)
+    if solution_path is None:
+        print("This puzzle is not solvable.")
+    else:
+        print(f"Solution found in {len(solution_path) - 1} moves:")
+        for step in solution_path:
+            print_puzzle(step)
+
+    for heuristic in (misplaced_tiles, manhattan_distance, linear_conflict):
+        print(f"IDA* with {heuristic.__name__}:")
+        solution_path = IDA_star(start_state, GOAL_STATE, heuristic)
+        if solution_path is not None:
+            print(f"Solution found in {len(solution_path) - 1} moves\n")
@@ -1,4 +1,11 @@
+import argparse
 import random
+import time
+
+try:
+    import numpy as np
+except ImportError:  # only the vectorized simulator below needs NumPy
+    np = None
 
 # Define environment
 rooms = {
@@ -11,6 +18,42 @@ rooms = {
 # Initial position of the agent
 agent_position = random.choice(['A', 'B', 'C', 'D'])
 
+# Rooms laid out on a 2x2 grid:  A B
+#                                C D
+ROOM_GRID = {'A': (0, 0), 'B': (0, 1), 'C': (1, 0), 'D': (1, 1)}
+
+# All-pairs travel distance between rooms (one move per neighbouring room)
+DISTANCE = {a: {b: abs(ra - rb) + abs(ca - cb) for b, (rb, cb) in ROOM_GRID.items()}
+            for a, (ra, ca) in ROOM_GRID.items()}
+
+def plan_tour(start, rooms_to_visit, distance):
+    """Order in which to visit every room, starting from start.
+
+    Nearest-neighbour tour, then 2-opt: any stretch of the tour whose
+    reversal shortens it is reversed, until no reversal helps.
+    """
+    path = [start]
+    remaining = sorted(set(rooms_to_visit) - {start})
+    while remaining:
+        nearest = min(remaining, key=lambda room: distance[path[-1]][room])
+        remaining.remove(nearest)
+        path.append(nearest)
+
+    improved = True
+    while improved:
+        improved = False
+        for i in range(1, len(path) - 1):
+            for j in range(i + 1, len(path)):
+                a, b, c = path[i - 1], path[i], path[j]
+                delta = distance[a][c] - distance[a][b]
+                if j + 1 < len(path):
+                    d = path[j + 1]
+                    delta += distance[b][d] - distance[c][d]
+                if delta < 0:
+                    path[i:j + 1] = path[i:j + 1][::-1]
+                    improved = True
+    return path[1:]
+
 # Display current state
 def display_state():
     print(f"Agent is in Room {agent_position}")
@@ -23,33 +66,139 @@ def vacuum_agent():
     global agent_position
     steps = 0
 
-    # Keep track of cleaned rooms
-    cleaned_rooms = set()
+    # Visit only the dirty rooms, along the shortest tour through them
+    dirty_rooms = [room for room in ROOM_GRID if rooms[room] == 'Dirty' and room != agent_position]
+    tour = plan_tour(agent_position, dirty_rooms, DISTANCE)
+    travel_cost = 0
 
-    while len(cleaned_rooms) < 4:
+    while tour or rooms[agent_position] == 'Dirty':
         display_state()
 
         # Clean current room if dirty
         if rooms[agent_position] == 'Dirty':
             print(f"🧹 Cleaning Room {agent_position}")
             rooms[agent_position] = 'Clean'
-            cleaned_rooms.add(agent_position)
         else:
             print(f"✅ Room {agent_position} is already clean.")
-            cleaned_rooms.add(agent_position)
 
-        # Decide next move only if not all rooms are clean
-        if len(cleaned_rooms) < 4:
-            # Move to the next room that is still dirty
-            for next_room in ['A', 'B', 'C', 'D']:
-                if next_room not in cleaned_rooms:
-                    agent_position = next_room
-                    break
+        # Move on only while dirty rooms are left
+        if tour:
+            # Move to the next room on the tour
+            next_room = tour.pop(0)
+            travel_cost += DISTANCE[agent_position][next_room]
+            print(f"Moving to Room {next_room} (distance {DISTANCE[agent_position][next_room]})")
+            agent_position = next_room
 
         steps += 1
         print(f"Step {steps} complete.\n")
 
     print("🎉 All rooms are clean!")
+    print(f"Total travel cost: {travel_cost}")
     display_state()
 
-vacuum_agent()
\ No newline at end of file
+
+# ---------------------------------------------------------
+# Vectorized environment: many independent vacuum worlds,
+# each a rows x cols grid of rooms, advanced in lockstep
+# ---------------------------------------------------------
+
+SUCK, UP, DOWN, LEFT, RIGHT = range(5)
+
+class VacuumWorld:
+    def __init__(self, num_envs, rows, cols, dirt_prob=0.5, seed=None):
+        if np is None:
+            raise ImportError("VacuumWorld needs NumPy")
+        self.num_envs, self.rows, self.cols = num_envs, rows, cols
+        self.rng = np.random.default_rng(seed)
+        # dirty[e, room] is True while room (row * cols + col) of env e is dirty
+        self.dirty = self.rng.random((num_envs, rows * cols)) < dirt_prob
+        self.position = self.rng.integers(0, rows * cols, num_envs)
+        # distance[a, b]: moves between rooms a and b, computed once for all pairs
+        row, col = np.divmod(np.arange(rows * cols), cols)
+        self.distance = (np.abs(row[:, None] - row[None, :])
+                         + np.abs(col[:, None] - col[None, :])).astype(np.int32)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.moves = np.zeros(num_envs, dtype=np.int64)
+        self.envs = np.arange(num_envs)
+
+    def active(self):
+        return self.dirty.any(axis=1)
+
+    def step(self, actions):
+        """Apply one action per environment; finished environments stay put"""
+        active = self.active()
+        suck = active & (actions == SUCK)
+        self.dirty[self.envs[suck], self.position[suck]] = False
+
+        row, col = np.divmod(self.position, self.cols)
+        row = np.clip(row - (actions == UP) + (actions == DOWN), 0, self.rows - 1)
+        col = np.clip(col - (actions == LEFT) + (actions == RIGHT), 0, self.cols - 1)
+        new_position = np.where(active, row * self.cols + col, self.position)
+
+        self.moves += new_position != self.position
+        self.position = new_position
+        self.steps += active
+        return active
+
+
+def move_toward(world, target):
+    """SUCK where the current room is dirty, otherwise one step toward the
+    target room (one per environment): rows first, then columns"""
+    here_dirty = world.dirty[world.envs, world.position]
+    target_row, target_col = np.divmod(target, world.cols)
+    row, col = np.divmod(world.position, world.cols)
+    actions = np.where(row < target_row, DOWN,
+              np.where(row > target_row, UP,
+              np.where(col < target_col, RIGHT, LEFT)))
+    return np.where(here_dirty, SUCK, actions)
+
+
+def first_dirty_policy(world):
+    """The rule from vacuum_agent(): clean the current room if it is dirty,
+    otherwise head for the lowest-numbered dirty room, one room per step"""
+    return move_toward(world, world.dirty.argmax(axis=1))
+
+
+def nearest_dirty_policy(world):
+    """Clean the current room if it is dirty, otherwise head for the
+    closest dirty room according to the distance index"""
+    distances = np.where(world.dirty, world.distance[world.position], np.iinfo(np.int32).max)
+    return move_toward(world, distances.argmin(axis=1))
+
+
+POLICIES = {"first": first_dirty_policy, "nearest": nearest_dirty_policy}
+
+
+def benchmark(num_envs, rows, cols, policy=first_dirty_policy, dirt_prob=0.5, seed=None):
+    """Run num_envs episodes headlessly until every room is clean"""
+    world = VacuumWorld(num_envs, rows, cols, dirt_prob, seed)
+    start = time.perf_counter()
+    while world.step(policy(world)).any():
+        pass
+    elapsed = time.perf_counter() - start
+    total_steps = int(world.steps.sum())
+    return {
+        "episodes": num_envs,
+        "steps": total_steps,
+        "moves": int(world.moves.sum()),
+        "mean_steps": total_steps / num_envs,
+        "mean_travel_cost": int(world.moves.sum()) / num_envs,
+        "steps_per_sec": total_steps / elapsed,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Vacuum cleaner world")
+    parser.add_argument("--benchmark", type=int, metavar="ENVS", help="run ENVS headless episodes instead of the demo")
+    parser.add_argument("--rows", type=int, default=4)
+    parser.add_argument("--cols", type=int, default=4)
+    parser.add_argument("--policy", choices=POLICIES, default="nearest")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        result = benchmark(args.benchmark, args.rows, args.cols, POLICIES[args.policy])
+        print(f"{result['episodes']} episodes on a {args.rows}x{args.cols} grid: "
+              f"{result['mean_steps']:.1f} steps and {result['mean_travel_cost']:.1f} travel each, "
+              f"{result['steps_per_sec']:,.0f} steps/sec")
+    else:
+        vacuum_agent()
\ No newline at end of file
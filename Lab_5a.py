@@ -1,12 +1,27 @@
+import argparse
 import heapq
+import itertools
+import json
+import math
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from Lab_2 import bfs, is_solvable, write_table
 
 class PuzzleState:
-    def __init__(self, board, parent=None, move="", depth=0, cost=0):
+    def __init__(self, board, parent=None, move="", depth=0, cost=0, manhattan=None, distances=None):
         self.board = board
         self.parent = parent
         self.move = move
         self.depth = depth
         self.cost = cost  # g(n) + h(n)
+        # Manhattan distance to the goal whose manhattan_table is distances,
+        # kept up to date move by move once a search has seeded it
+        self.manhattan = manhattan
+        self.distances = distances
 
     def __lt__(self, other):
         return self.cost < other.cost
@@ -14,11 +29,16 @@ class PuzzleState:
     def find_blank(self):
         return self.board.index(0)
 
+    def size(self):
+        """Side length of the board: 3 for the 8-puzzle, 4 for the 15-puzzle"""
+        return math.isqrt(len(self.board))
+
     def get_moves(self):
         """Generate possible moves"""
         blank = self.find_blank()
         moves = []
-        row, col = divmod(blank, 3)
+        size = self.size()
+        row, col = divmod(blank, size)
         directions = {
             "Up": (row - 1, col),
             "Down": (row + 1, col),
@@ -26,11 +46,17 @@ class PuzzleState:
             "Right": (row, col + 1)
         }
         for move, (r, c) in directions.items():
-            if 0 <= r < 3 and 0 <= c < 3:
-                new_blank = r * 3 + c
+            if 0 <= r < size and 0 <= c < size:
+                new_blank = r * size + c
                 new_board = self.board[:]
                 new_board[blank], new_board[new_blank] = new_board[new_blank], new_board[blank]
-                moves.append(PuzzleState(new_board, self, move, self.depth + 1))
+                manhattan = self.manhattan
+                if manhattan is not None:
+                    # Only the tile that slid into the old blank changed distance
+                    tile_distances = self.distances[new_board[blank]]
+                    manhattan += tile_distances[blank] - tile_distances[new_blank]
+                moves.append(PuzzleState(new_board, self, move, self.depth + 1,
+                                         manhattan=manhattan, distances=self.distances))
         return moves
 
     def path(self):
@@ -42,97 +68,490 @@ class PuzzleState:
         return list(reversed(p))
 
     def print_board(self):
-        """Print the board in 3x3 matrix form"""
-        for i in range(0, 9, 3):
-            print(self.board[i:i+3])  # Print rows of the board
+        """Print the board in matrix form"""
+        size = self.size()
+        for i in range(0, len(self.board), size):
+            print(self.board[i:i+size])  # Print rows of the board
 
 
 # ----------------- Heuristics -----------------
 def misplaced_tiles(state, goal):
-    return sum(1 for i in range(9) if state.board[i] != 0 and state.board[i] != goal[i])
+    return sum(1 for i in range(len(goal)) if state.board[i] != 0 and state.board[i] != goal[i])
+
+# Per-goal lookup tables, built on first use
+GOAL_POSITIONS = {}
+MANHATTAN_TABLES = {}
+
+def goal_positions(goal):
+    """positions[tile] = (row, col) of tile in goal"""
+    key = tuple(goal)
+    if key not in GOAL_POSITIONS:
+        size = math.isqrt(len(goal))
+        positions = [None] * len(goal)
+        for i, tile in enumerate(goal):
+            positions[tile] = divmod(i, size)
+        GOAL_POSITIONS[key] = positions
+    return GOAL_POSITIONS[key]
+
+def manhattan_table(goal):
+    """table[tile][cell] = Manhattan distance from cell to tile's goal cell (0 for the blank)"""
+    key = tuple(goal)
+    if key not in MANHATTAN_TABLES:
+        positions = goal_positions(goal)
+        cells = len(goal)
+        size = math.isqrt(cells)
+        table = [[0] * cells for _ in range(cells)]
+        for tile in range(1, cells):
+            r2, c2 = positions[tile]
+            for i in range(cells):
+                r1, c1 = divmod(i, size)
+                table[tile][i] = abs(r1 - r2) + abs(c1 - c2)
+        MANHATTAN_TABLES[key] = table
+    return MANHATTAN_TABLES[key]
 
 def manhattan_distance(state, goal):
-    dist = 0
-    for i in range(9):
-        if state.board[i] != 0:
-            r1, c1 = divmod(i, 3)
-            r2, c2 = divmod(goal.index(state.board[i]), 3)
-            dist += abs(r1 - r2) + abs(c1 - c2)
-    return dist
+    # States from a seeded search carry their distance, updated in O(1) per move
+    manhattan = getattr(state, "manhattan", None)
+    if manhattan is not None:
+        return manhattan
+    table = manhattan_table(goal)
+    return sum(table[tile][i] for i, tile in enumerate(state.board))
+
+def longest_increasing(seq):
+    """Length of the longest strictly increasing subsequence"""
+    best = []
+    for i in range(len(seq)):
+        best.append(1 + max([best[j] for j in range(i) if seq[j] < seq[i]], default=0))
+    return max(best, default=0)
+
+def conflict_moves(board, positions, size):
+    """2 moves for every tile that has to leave its goal row (or column) so
+    the other tiles in it can pass each other"""
+    extra = 0
+    for line in range(size):
+        row, col = [], []
+        for i in range(size):
+            tile = board[line * size + i]
+            if tile != 0 and positions[tile][0] == line:
+                row.append(positions[tile][1])
+            tile = board[i * size + line]
+            if tile != 0 and positions[tile][1] == line:
+                col.append(positions[tile][0])
+        # Tiles outside a longest in-order run are the fewest that must step aside
+        extra += 2 * (len(row) - longest_increasing(row))
+        extra += 2 * (len(col) - longest_increasing(col))
+    return extra
+
+def linear_conflict(state, goal):
+    """Manhattan distance plus the moves conflict_moves counts"""
+    extra = conflict_moves(state.board, goal_positions(goal), math.isqrt(len(goal)))
+    return manhattan_distance(state, goal) + extra
+
+
+# ----------------- Pattern databases -----------------
+# A pattern database stores, for every placement of a group of tiles, the
+# fewest moves of those tiles needed to bring them home, found by BFS
+# backwards from the goal with all other tiles treated as indistinguishable.
+# Only moves of the group's own tiles are counted, so the databases of
+# disjoint groups can be added together and stay admissible.
+# Tables are one byte per placement, indexed by the group's cells in base
+# N (N = cells on the board), and are memory-mapped from disk once built.
+
+DEFAULT_PARTITIONS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 5, 6, 9), (3, 4, 7, 8, 12), (10, 11, 13, 14, 15)],
+}
+UNSEEN = 255
+
+def pdb_file(goal, pattern, directory=None):
+    size = math.isqrt(len(goal))
+    name = (f"pdb_{size}x{size}_" + "-".join(map(str, goal)) + "_"
+            + "-".join(map(str, pattern)) + ".pdb")
+    return os.path.join(directory or os.path.dirname(os.path.abspath(__file__)), name)
+
+def build_pattern_database(goal, pattern, filename):
+    """Retrograde 0-1 BFS over (group cells, blank cell); writes the table.
+
+    The blank is the least significant digit of a search state, so sliding
+    it over an untracked tile (cost 0) or a group tile (cost 1) is plain
+    integer arithmetic on the state.
+    """
+    cells = len(goal)
+    size = math.isqrt(cells)
+    k = len(pattern)
+    neighbors = []
+    for cell in range(cells):
+        r, c = divmod(cell, size)
+        neighbors.append([nr * size + nc for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1))
+                          if 0 <= nr < size and 0 <= nc < size])
+    # Weight of group tile j's digit in a search state
+    weights = [cells ** (k - j) for j in range(k)]
+
+    start = 0
+    for tile in pattern:
+        start = start * cells + goal.index(tile)
+    start = start * cells + goal.index(0)
+
+    distance = bytearray([UNSEEN]) * cells ** (k + 1)
+    table = bytearray([UNSEEN]) * cells ** k
+    distance[start] = 0
+    table[start // cells] = 0
+    level, d = [start], 0
+    while level:
+        next_level = []
+        # Everything reachable at cost d through free blank moves is found
+        # first (stack), cost d + 1 states are collected for the next level
+        stack = [state for state in level if distance[state] == d]
+        while stack:
+            state = stack.pop()
+            blank = state % cells
+            occupied = {}
+            rest = state // cells
+            for j in range(k - 1, -1, -1):
+                rest, cell = divmod(rest, cells)
+                occupied[cell] = j
+            for cell in neighbors[blank]:
+                j = occupied.get(cell)
+                if j is None:
+                    child, cost = state + cell - blank, d
+                else:
+                    child, cost = state + (blank - cell) * weights[j] + cell - blank, d + 1
+                if distance[child] > cost:
+                    distance[child] = cost
+                    if table[child // cells] > cost:
+                        table[child // cells] = cost
+                    if cost == d:
+                        stack.append(child)
+                    else:
+                        next_level.append(child)
+        level, d = next_level, d + 1
+
+    write_table(filename, table)
+
+def load_pattern_database(goal, pattern, directory=None):
+    """Memory-map the table for one tile group, building it on first use"""
+    filename = pdb_file(goal, pattern, directory)
+    if not os.path.exists(filename):
+        build_pattern_database(goal, pattern, filename)
+    with open(filename, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+def pattern_database_heuristic(goal, partition=None, directory=None):
+    """Additive heuristic from disjoint pattern databases, usable like
+    manhattan_distance(state, goal) for the goal it was built for"""
+    cells = len(goal)
+    partition = partition or DEFAULT_PARTITIONS[math.isqrt(cells)]
+    tables = [(pattern, load_pattern_database(goal, pattern, directory)) for pattern in partition]
+
+    def pdb_heuristic(state, goal):
+        where = [0] * cells
+        for i, tile in enumerate(state.board):
+            where[tile] = i
+        h = 0
+        for pattern, table in tables:
+            index = 0
+            for tile in pattern:
+                index = index * cells + where[tile]
+            h += table[index]
+        return h
+    return pdb_heuristic
 
 
 # ----------------- A* Search -----------------
-def a_star(start, goal, heuristic):
-    open_list = []
-    closed_set = set()
+# Not Lab_2's pack: first cell in the highest bits, no blank index, and as
+# many bits per tile as the largest tile needs (4 up to 4x4, 5 on 5x5, ...)
+def board_key(board):
+    """Board as one int: a compact hashable state key"""
+    bits = (len(board) - 1).bit_length()
+    key = 0
+    for tile in board:
+        key = key << bits | tile
+    return key
+
+def key_board(key, cells):
+    bits = (cells - 1).bit_length()
+    mask = (1 << bits) - 1
+    board = [0] * cells
+    for i in range(cells - 1, -1, -1):
+        board[i] = key & mask
+        key >>= bits
+    return board
+
+def a_star(start, goal, heuristic, stats=None, weight=1.0):
+    # The open list holds (f, h, counter, state) tuples: ties on f go to the
+    # state nearer the goal, then first-in, and PuzzleState is never compared.
+    # best_g tracks the cheapest path queued per packed state, so a neighbor
+    # is only pushed when it improves on it; superseded heap entries are
+    # skipped when popped (lazy deletion).
+    #
+    # weight > 1 gives weighted A*, f = g + weight * h: far fewer expansions,
+    # and the solution is at most weight times longer than optimal (reported
+    # as "suboptimality" in stats).
     start_state = PuzzleState(start)
-    start_state.cost = heuristic(start_state, goal)
-    heapq.heappush(open_list, start_state)
+    # Seed the incremental Manhattan distance; children update it per move
+    start_state.manhattan = manhattan_distance(start_state, goal)
+    start_state.distances = manhattan_table(goal)
+    h = heuristic(start_state, goal)
+    start_state.cost = weight * h
+    counter = itertools.count()
+    open_list = [(start_state.cost, h, next(counter), start_state)]
+    best_g = {board_key(start): 0}
+    closed_set = set()
+    pushes, expanded, peak = 1, 0, 1
+    result = None
 
     while open_list:
-        current = heapq.heappop(open_list)
+        _, _, _, current = heapq.heappop(open_list)
+        key = board_key(current.board)
+        if key in closed_set or current.depth > best_g[key]:
+            continue
 
         if current.board == goal:
-            return current.path()
+            result = current.path()
+            break
 
-        closed_set.add(tuple(current.board))
+        closed_set.add(key)
+        expanded += 1
 
         for neighbor in current.get_moves():
-            if tuple(neighbor.board) in closed_set:
+            neighbor_key = board_key(neighbor.board)
+            if neighbor_key in closed_set:
+                continue
+            if neighbor.depth >= best_g.get(neighbor_key, neighbor.depth + 1):
                 continue
-            neighbor.cost = neighbor.depth + heuristic(neighbor, goal)
-            heapq.heappush(open_list, neighbor)
+            best_g[neighbor_key] = neighbor.depth
+            h = heuristic(neighbor, goal)
+            neighbor.cost = neighbor.depth + weight * h
+            heapq.heappush(open_list, (neighbor.cost, h, next(counter), neighbor))
+            pushes += 1
+        peak = max(peak, len(open_list))
+
+    if stats is not None:
+        stats.update(pushes=pushes, expanded=expanded, peak_open=peak, suboptimality=weight)
+    return result
+
+
+# ----------------- Anytime A* -----------------
+def key_path(parent, key, cells):
+    """Rebuild the path() format from a dict mapping packed states to their parents"""
+    size = math.isqrt(cells)
+    names = {-size: "Up", size: "Down", -1: "Left", 1: "Right"}
+    boards = []
+    while key is not None:
+        boards.append(key_board(key, cells))
+        key = parent[key]
+    boards.reverse()
+    p = [("", boards[0])]
+    for before, after in zip(boards, boards[1:]):
+        p.append((names[after.index(0) - before.index(0)], after))
+    return p
+
+def anytime_a_star(start, goal, heuristic, time_limit, weight=3.0, weight_step=0.5):
+    """Anytime Repairing A* (ARA*): yields (path, bound) pairs, each path at
+    most bound times longer than optimal, until the bound reaches 1 or
+    time_limit seconds have passed.
+
+    The first pass is weighted A* with a large weight, which finds a path
+    quickly. Each later pass lowers the weight and reuses the g values and
+    open list of the previous pass. Only states whose g improved after they
+    were expanded are searched again.
+    """
+    deadline = time.perf_counter() + time_limit
+    cells = len(start)
+    start_key, goal_key = board_key(start), board_key(goal)
+    if start_key == goal_key:
+        yield [("", list(start))], 1.0
+        return
+
+    start_state = PuzzleState(list(start))
+    start_state.manhattan = manhattan_distance(start_state, goal)
+    start_state.distances = manhattan_table(goal)
+    g = {start_key: 0}
+    h = {start_key: heuristic(start_state, goal)}
+    parent = {start_key: None}
+    counter = itertools.count()
+    # (f, h, counter, key) entries: ties on f go to the state nearer the goal
+    open_list = [(weight * h[start_key], h[start_key], next(counter), start_key)]
+    incons = set()   # states improved after being expanded in this pass
+    best = None
+
+    while True:
+        closed = set()
+        while open_list and (goal_key not in g or open_list[0][0] < g[goal_key]):
+            if time.perf_counter() > deadline:
+                return
+            f, _, _, key = heapq.heappop(open_list)
+            if key in closed or f > g[key] + weight * h[key]:
+                continue
+            closed.add(key)
+            for neighbor in PuzzleState(key_board(key, cells)).get_moves():
+                neighbor_key = board_key(neighbor.board)
+                if g[key] + 1 >= g.get(neighbor_key, g[key] + 2):
+                    continue
+                g[neighbor_key] = g[key] + 1
+                parent[neighbor_key] = key
+                if neighbor_key not in h:
+                    h[neighbor_key] = heuristic(neighbor, goal)
+                if neighbor_key in closed:
+                    incons.add(neighbor_key)
+                else:
+                    heapq.heappush(open_list, (g[neighbor_key] + weight * h[neighbor_key], h[neighbor_key],
+                                               next(counter), neighbor_key))
+        if goal_key not in g:
+            return  # open list exhausted: goal unreachable
+
+        # Every path to the goal still runs through an open or inconsistent
+        # state, so the smallest g + h there bounds the optimal length
+        frontier = {key for _, _, _, key in open_list if key not in closed} | incons
+        lower = min((g[key] + h[key] for key in frontier), default=g[goal_key])
+        bound = max(1.0, min(weight, g[goal_key] / lower) if lower else weight)
+        # Only report a pass that shortened the path or tightened the bound
+        if best is None or (g[goal_key], bound) < best:
+            best = (g[goal_key], bound)
+            yield key_path(parent, goal_key, cells), bound
+        if weight <= 1.0 or bound <= 1.0:
+            return
 
-    return None
+        weight = max(1.0, weight - weight_step)
+        open_list = [(g[key] + weight * h[key], h[key], next(counter), key) for key in frontier]
+        heapq.heapify(open_list)
+        incons = set()
+
+
+# ----------------- Batch solving -----------------
+HEURISTICS = {
+    "misplaced": misplaced_tiles,
+    "manhattan": manhattan_distance,
+    "linear_conflict": linear_conflict,
+}
+# Pattern-database heuristics loaded in this process, by goal
+PDB_HEURISTICS = {}
+
+def default_goal(cells):
+    return list(range(1, cells)) + [0]
+
+def get_heuristic(name, goal):
+    """Heuristic by name; pattern databases are mapped once per process"""
+    if name != "pdb":
+        return HEURISTICS[name]
+    key = tuple(goal)
+    if key not in PDB_HEURISTICS:
+        PDB_HEURISTICS[key] = pattern_database_heuristic(goal)
+    return PDB_HEURISTICS[key]
+
+def parse_instance(line):
+    """Tiles in row order, separated by spaces or commas, 0 for the blank.
+    Raises ValueError unless they are a permutation of 0..n*n-1."""
+    try:
+        tiles = [int(tile) for tile in line.replace(",", " ").split()]
+    except ValueError:
+        raise ValueError(f"not a list of integers: {line.strip()!r}") from None
+    size = math.isqrt(len(tiles))
+    if size < 2 or size * size != len(tiles):
+        raise ValueError(f"{len(tiles)} tiles do not fill a square board")
+    if sorted(tiles) != list(range(len(tiles))):
+        raise ValueError(f"tiles are not a permutation of 0..{len(tiles) - 1}")
+    return tiles
+
+def solve_instance(task):
+    """Worker: solve one instance and return its JSON-ready result. A bad
+    line or a failed search gives {"instance": k, "error": ...} instead of
+    stopping the batch."""
+    number, line, algorithm, heuristic, weight = task
+    try:
+        start = parse_instance(line)
+        if algorithm == "bfs" and len(start) != 9:
+            raise ValueError("bfs only solves the 8-puzzle")
+        goal = default_goal(len(start))
+        result = {"instance": number, "start": start}
+        began = time.perf_counter()
+        if not is_solvable(start, goal):
+            result.update(solvable=False, length=None, expanded=0)
+        else:
+            stats = {}
+            if algorithm == "bfs":
+                path = bfs(start, goal, stats=stats)
+                expanded = stats["forward_expanded"] + stats["backward_expanded"]
+            else:
+                path = a_star(start, goal, get_heuristic(heuristic, goal), stats, weight)
+                expanded = stats["expanded"]
+            result.update(solvable=True, length=len(path) - 1, expanded=expanded,
+                          bound=weight if algorithm == "astar" else 1.0)
+        result["time"] = time.perf_counter() - began
+        return result
+    except Exception as e:
+        return {"instance": number, "error": f"{type(e).__name__}: {e}"}
+
+def solve_batch(lines, output, algorithm="astar", heuristic="manhattan", workers=None, weight=1.0):
+    """Solve one instance per line across a process pool, writing one JSON
+    result per line to output as soon as it is ready (in input order)"""
+    tasks = []
+    for line in lines:
+        if line.strip() and not line.lstrip().startswith("#"):
+            tasks.append((len(tasks) + 1, line, algorithm, heuristic, weight))
+    if algorithm == "astar" and heuristic == "pdb":
+        # Build missing databases once here, so workers only map the files;
+        # bad lines are reported by the workers
+        cells = set()
+        for _, line, _, _, _ in tasks:
+            try:
+                cells.add(len(parse_instance(line)))
+            except ValueError:
+                pass
+        for size in cells:
+            if math.isqrt(size) in DEFAULT_PARTITIONS:
+                get_heuristic(heuristic, default_goal(size))
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(solve_instance, tasks, chunksize=8):
+            output.write(json.dumps(result) + "\n")
+            output.flush()
 
 
 # ----------------- Example Run -----------------
-# if __name__ == "__main__":
-    initial_state = [1, 2, 3,
-                     4, 7, 5,
-                     6, 8, 0]
-
-    goal_state =    [1, 2, 3,
-                     4, 0, 5,
-                     6, 7, 8]
-
-    print("A* with Misplaced Tiles:")
-    solution1 = a_star(initial_state, goal_state, misplaced_tiles)
-    for move, state in solution1:
-        print(f"Move: {move}")
-        PuzzleState(state).print_board()  # Print the board as a matrix
-
-    print("\nA* with Manhattan Distance:")
-    solution2 = a_star(initial_state, goal_state, manhattan_distance)
-    for move, state in solution2:
-        print(f"Move: {move}")
-        PuzzleState(state).print_board()  # Print the board as a matrix
 if __name__ == "__main__":
-    initial_state = [1, 2, 3,
-                     4, 7, 5,
-                     6, 8, 0]
-
-    goal_state =    [1, 2, 3,
-                     4, 0, 5,
-                     6, 7, 8]
-
-    print("A* with Misplaced Tiles:")
-    solution1 = a_star(initial_state, goal_state, misplaced_tiles)
-    for idx, (move, state) in enumerate(solution1):
-        ps = PuzzleState(state)
-        h = misplaced_tiles(ps, goal_state)
-        g = idx  # depth = move number in path
-        cost = g + h
-        print(f"Move: {move}, Depth: {g}, Heuristic: {h}, Total cost: {cost}")
-        ps.print_board()
-
-    print("\nA* with Manhattan Distance:")
-    solution2 = a_star(initial_state, goal_state, manhattan_distance)
-    for idx, (move, state) in enumerate(solution2):
-        ps = PuzzleState(state)
-        h = manhattan_distance(ps, goal_state)
-        g = idx  # depth
-        cost = g + h
-        print(f"Move: {move}, Depth: {g}, Heuristic: {h}, Total cost: {cost}")
-        ps.print_board()
+    parser = argparse.ArgumentParser(description="Sliding-tile puzzles with A*")
+    parser.add_argument("--batch", metavar="FILE", help="instances to solve, one per line (default: run the examples)")
+    parser.add_argument("--output", metavar="FILE", help="JSON lines output (default: stdout)")
+    parser.add_argument("--algorithm", choices=["astar", "bfs"], default="astar")
+    parser.add_argument("--heuristic", choices=[*HEURISTICS, "pdb"], default="manhattan")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--weight", type=float, default=1.0, help="weighted A*: f = g + WEIGHT * h")
+    args = parser.parse_args()
+
+    if args.batch:
+        with open(args.batch) as lines:
+            if args.output:
+                with open(args.output, "w") as output:
+                    solve_batch(lines, output, args.algorithm, args.heuristic, args.workers, args.weight)
+            else:
+                solve_batch(lines, sys.stdout, args.algorithm, args.heuristic, args.workers, args.weight)
+    else:
+        initial_state = [1, 2, 3,
+                         4, 7, 5,
+                         6, 8, 0]
+
+        goal_state =    [1, 2, 3,
+                         4, 0, 5,
+                         6, 7, 8]
+
+        print("A* with Misplaced Tiles:")
+        solution1 = a_star(initial_state, goal_state, misplaced_tiles)
+        for idx, (move, state) in enumerate(solution1):
+            ps = PuzzleState(state)
+            h = misplaced_tiles(ps, goal_state)
+            g = idx  # depth = move number in path
+            cost = g + h
+            print(f"Move: {move}, Depth: {g}, Heuristic: {h}, Total cost: {cost}")
+            ps.print_board()
 
+        print("\nA* with Manhattan Distance:")
+        solution2 = a_star(initial_state, goal_state, manhattan_distance)
+        for idx, (move, state) in enumerate(solution2):
+            ps = PuzzleState(state)
+            h = manhattan_distance(ps, goal_state)
+            g = idx  # depth
+            cost = g + h
+            print(f"Move: {move}, Depth: {g}, Heuristic: {h}, Total cost: {cost}")
+            ps.print_board()
@@ -1,14 +1,56 @@
+import argparse
 import random
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # only the vectorized steepest ascent needs NumPy
+    np = None
+
+class QueenCounters:
+    """Queens per row, diagonal and anti-diagonal for a board, so the
+    conflicts of the board and of any single-queen move come in O(1)."""
+
+    def __init__(self, state):
+        n = len(state)
+        self.n = n
+        # Flat int arrays keep a million-queen board to a few megabytes
+        self.state = array("i", state)
+        self.rows = array("i", bytes(4 * n))
+        self.diags = array("i", bytes(4 * (2 * n - 1)))    # index row - col + n - 1
+        self.antis = array("i", bytes(4 * (2 * n - 1)))    # index row + col
+        for col, row in enumerate(self.state):
+            self.rows[row] += 1
+            self.diags[row - col + n - 1] += 1
+            self.antis[row + col] += 1
+        # k queens on one line make k * (k - 1) / 2 attacking pairs
+        self.conflicts = sum(k * (k - 1) // 2 for counts in (self.rows, self.diags, self.antis)
+                             for k in counts)
+
+    def delta(self, col, row):
+        """Change in conflicts if the queen in col moved to row (row differs)"""
+        n = self.n
+        old = self.state[col]
+        lost = (self.rows[old] - 1) + (self.diags[old - col + n - 1] - 1) + (self.antis[old + col] - 1)
+        gained = self.rows[row] + self.diags[row - col + n - 1] + self.antis[row + col]
+        return gained - lost
+
+    def move(self, col, row):
+        n = self.n
+        old = self.state[col]
+        self.conflicts += self.delta(col, row)
+        self.rows[old] -= 1
+        self.diags[old - col + n - 1] -= 1
+        self.antis[old + col] -= 1
+        self.rows[row] += 1
+        self.diags[row - col + n - 1] += 1
+        self.antis[row + col] += 1
+        self.state[col] = row
 
 def conflicts(state):
     """Count number of pairs of queens attacking each other."""
-    n = len(state)
-    count = 0
-    for i in range(n):
-        for j in range(i + 1, n):
-            if state[i] == state[j] or abs(state[i] - state[j]) == abs(i - j):
-                count += 1
-    return count
+    return QueenCounters(state).conflicts
 
 def generate_neighbors(state):
     """Generate all neighbors by moving one queen to another row in its column."""
@@ -22,6 +64,32 @@ def generate_neighbors(state):
                 neighbors.append(neighbor)
     return neighbors
 
+def move_conflicts(board, index=None):
+    """n x n matrix whose [row, col] entry is the conflicts left after moving
+    the queen in col to row, built from the counters in a few array passes.
+    index caches the (diagonal, anti-diagonal) index matrices between calls."""
+    if np is None:
+        raise ImportError("move_conflicts needs NumPy")
+    n = board.n
+    if index is None:
+        index = move_index(n)
+    diag_index, anti_index = index
+    # Zero-copy int32 views of the counters, so board.move keeps them current
+    state = np.frombuffer(board.state, dtype=np.int32)
+    rows = np.frombuffer(board.rows, dtype=np.int32)
+    diags = np.frombuffer(board.diags, dtype=np.int32)
+    antis = np.frombuffer(board.antis, dtype=np.int32)
+    cols = np.arange(n)
+    lost = rows[state] + diags[state - cols + n - 1] + antis[state + cols] - 3
+    gained = rows[:, None] + diags[diag_index] + antis[anti_index]
+    matrix = board.conflicts + gained - lost
+    matrix[state, cols] = board.conflicts
+    return matrix
+
+def move_index(n):
+    row, col = np.ogrid[:n, :n]
+    return row - col + n - 1, row + col
+
 def print_board(state):
     """Print the board configuration."""
     n = len(state)
@@ -35,16 +103,20 @@ def print_board(state):
         print(line)
     print("\n")
 
-def hill_climbing_n_queens(n, max_iterations=1000, max_restarts=50):
+def hill_climbing_n_queens(n, max_iterations=1000, max_restarts=50, verbose=True, vectorized=False):
+    if vectorized:
+        index = move_index(n)
+
     def random_state():
         return [random.randint(0, n - 1) for _ in range(n)]
 
-    current_state = random_state()
-    current_conflicts = conflicts(current_state)
+    board = QueenCounters(random_state())
+    current_conflicts = board.conflicts
 
-    print("Initial board:")
-    print_board(current_state)
-    print(f"Initial conflicts: {current_conflicts}\n")
+    if verbose:
+        print("Initial board:")
+        print_board(board.state)
+        print(f"Initial conflicts: {current_conflicts}\n")
 
     restarts = 0
     iteration = 0
@@ -53,62 +125,178 @@ def hill_climbing_n_queens(n, max_iterations=1000, max_restarts=50):
         improved = True
         while improved and iteration < max_iterations:
             iteration += 1
-            neighbors = generate_neighbors(current_state)
-            neighbor_conflicts = [conflicts(neigh) for neigh in neighbors]
-
-            min_conflicts = min(neighbor_conflicts)
-            min_indices = [i for i, val in enumerate(neighbor_conflicts) if val == min_conflicts]
-
-            if min_conflicts < current_conflicts:
-                chosen_index = random.choice(min_indices)
-                next_state = neighbors[chosen_index]
-                # Find which column changed and rows before/after
+            # Score every single-queen move by its O(1) delta instead of
+            # building and recounting each neighbor board
+            best_delta = None
+            best_moves = []
+            if vectorized:
+                matrix = move_conflicts(board, index)
+                matrix[np.frombuffer(board.state, dtype=np.int32), np.arange(n)] = 3 * n * n    # staying put is not a move
+                lowest = matrix.min()
+                best_delta = int(lowest) - current_conflicts
+                rows, cols = np.nonzero(matrix == lowest)
+                best_moves = list(zip(cols.tolist(), rows.tolist()))
+            else:
                 for col in range(n):
-                    if current_state[col] != next_state[col]:
-                        moved_col = col
-                        old_row = current_state[col]
-                        new_row = next_state[col]
-                        break
-                direction = "up" if new_row < old_row else "down"
-                print(f"Iteration {iteration}: Moved queen in column {moved_col} from row {old_row} {direction} to row {new_row}, conflicts {min_conflicts}")
-                current_state = next_state
-                current_conflicts = min_conflicts
+                    for row in range(n):
+                        if row != board.state[col]:
+                            delta = board.delta(col, row)
+                            if best_delta is None or delta < best_delta:
+                                best_delta = delta
+                                best_moves = [(col, row)]
+                            elif delta == best_delta:
+                                best_moves.append((col, row))
 
-            elif min_conflicts == current_conflicts:
-                chosen_index = random.choice(min_indices)
-                next_state = neighbors[chosen_index]
-                # Find which column changed and rows before/after
-                for col in range(n):
-                    if current_state[col] != next_state[col]:
-                        moved_col = col
-                        old_row = current_state[col]
-                        new_row = next_state[col]
-                        break
-                direction = "up" if new_row < old_row else "down"
-                print(f"Iteration {iteration}: Moved queen in column {moved_col} from row {old_row} {direction} to row {new_row} (equal objective), conflicts {min_conflicts}")
-                current_state = next_state
+            min_conflicts = current_conflicts + best_delta
+
+            if min_conflicts <= current_conflicts:
+                moved_col, new_row = random.choice(best_moves)
+                old_row = board.state[moved_col]
+                board.move(moved_col, new_row)
+                if verbose:
+                    direction = "up" if new_row < old_row else "down"
+                    equal = " (equal objective)" if min_conflicts == current_conflicts else ""
+                    print(f"Iteration {iteration}: Moved queen in column {moved_col} from row {old_row} {direction} to row {new_row}{equal}, conflicts {min_conflicts}")
                 current_conflicts = min_conflicts
 
             else:
-                print(f"Iteration {iteration}: Local optimum reached with conflicts {current_conflicts}")
+                if verbose:
+                    print(f"Iteration {iteration}: Local optimum reached with conflicts {current_conflicts}")
                 improved = False
 
         if current_conflicts == 0:
-            print("\nGlobal optimum found!")
+            if verbose:
+                print("\nGlobal optimum found!")
             break
 
         restarts += 1
-        current_state = random_state()
-        current_conflicts = conflicts(current_state)
-        print(f"\nRestart {restarts}: New random state with conflicts {current_conflicts}")
-
-    print("\nFinal board:")
-    print_board(current_state)
-    print(f"Final conflicts: {current_conflicts}")
-    print(f"Total iterations: {iteration}")
-    print(f"Total restarts: {restarts}")
-    return current_state
-
-# Example: Solve 8-Queens
-n = 5
-hill_climbing_n_queens(n)
+        board = QueenCounters(random_state())
+        current_conflicts = board.conflicts
+        if verbose:
+            print(f"\nRestart {restarts}: New random state with conflicts {current_conflicts}")
+
+    if verbose:
+        print("\nFinal board:")
+        print_board(board.state)
+        print(f"Final conflicts: {current_conflicts}")
+        print(f"Total iterations: {iteration}")
+        print(f"Total restarts: {restarts}")
+    return list(board.state)
+
+def greedy_state(n, rng, tries=100, tail=50):
+    """Give every column an unused row, retrying random rows to find one on
+    free diagonals, so only a handful of conflicts are left. The last tail
+    columns take any row, as free diagonals get rare there."""
+    pool = array("i", range(n))
+    diag_used = bytearray(2 * n - 1)
+    anti_used = bytearray(2 * n - 1)
+    tail = min(tail, n // 10)
+    for col in range(n):
+        for _ in range(tries if col < n - tail else 1):
+            pick = rng.randrange(col, n)
+            row = pool[pick]
+            if not diag_used[row - col + n - 1] and not anti_used[row + col]:
+                break
+        pool[col], pool[pick] = pool[pick], pool[col]
+        row = pool[col]
+        diag_used[row - col + n - 1] = 1
+        anti_used[row + col] = 1
+    return pool
+
+def min_conflicts_n_queens(n, max_steps=None, candidates=64, seed=None, stats=None):
+    """Min-conflicts search: pick a random conflicted column and move its
+    queen to the least-conflicted row. Rows are all scanned when n <=
+    candidates, otherwise that many random rows are sampled per move.
+    n = 2 and n = 3 have no solution, so only stop there with max_steps."""
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    board = QueenCounters(greedy_state(n, rng))
+    initial_conflicts = board.conflicts
+    state, rows, diags, antis = board.state, board.rows, board.diags, board.antis
+    offset = n - 1
+    randrange = rng.randrange
+
+    # Column last moved into each row, so the queen a move lands on can be
+    # queued; diagonal partners are only picked up by rescans
+    row_owner = array("i", bytes(4 * n))
+    for col, row in enumerate(state):
+        row_owner[row] = col
+    # Rows emptied by earlier moves are always tried, as they are usually
+    # the only rows a queen can enter without a row conflict
+    empty_rows = [row for row in range(n) if not rows[row]]
+    placed = time.perf_counter()
+
+    def attacked(col):
+        row = state[col]
+        return rows[row] + diags[row - col + offset] + antis[row + col] > 3
+
+    conflicted = []
+    iterations = moves = rescans = 0
+    next_rescan = 0
+    while max_steps is None or iterations < max_steps:
+        if not conflicted or iterations >= next_rescan:
+            rescans += 1
+            conflicted = [col for col, row in enumerate(state)
+                          if rows[row] + diags[row - col + offset] + antis[row + col] > 3]
+            if not conflicted:
+                break
+            next_rescan = iterations + len(conflicted) + n // 50
+        iterations += 1
+        i = randrange(len(conflicted))
+        col = conflicted[i]
+        if not attacked(col):
+            conflicted[i] = conflicted[-1]
+            conflicted.pop()
+            continue
+
+        current = state[col]
+        empty_rows = [row for row in empty_rows if not rows[row]]
+        if n <= candidates:
+            tried = list(range(n))
+            rng.shuffle(tried)
+        else:
+            tried = [randrange(n) for _ in range(candidates)] + empty_rows
+        # The queen always leaves its row, even for a worse one, so the
+        # search cannot sit in a local minimum
+        best_row, best_score = current, 3 * n
+        for row in tried:
+            if row != current:
+                score = rows[row] + diags[row - col + offset] + antis[row + col]
+                if score < best_score:
+                    best_row, best_score = row, score
+        if best_row != current:
+            if rows[best_row]:
+                conflicted.append(row_owner[best_row])
+            row_owner[best_row] = col
+            board.move(col, best_row)
+            moves += 1
+            if not rows[current]:
+                empty_rows.append(current)
+
+    end = time.perf_counter()
+    if stats is not None:
+        search = end - placed
+        stats.update(iterations=iterations, moves=moves, rescans=rescans,
+                     initial_conflicts=initial_conflicts, conflicts=board.conflicts,
+                     setup_seconds=placed - start, search_seconds=search,
+                     iterations_per_sec=iterations / search if search else 0.0)
+    return state
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="N-Queens local search")
+    parser.add_argument("--min-conflicts", type=int, metavar="N", help="solve N queens with min-conflicts instead of the demo")
+    parser.add_argument("--max-steps", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--queens", type=int, default=5, help="board size for the hill climbing demo")
+    parser.add_argument("--vectorized", action="store_true", help="score hill climbing moves with NumPy")
+    args = parser.parse_args()
+
+    if args.min_conflicts:
+        stats = {}
+        min_conflicts_n_queens(args.min_conflicts, args.max_steps, seed=args.seed, stats=stats)
+        print(f"{args.min_conflicts} queens: {stats['initial_conflicts']} conflicts after greedy placement, "
+              f"{stats['conflicts']} after {stats['iterations']} iterations ({stats['moves']} moves, "
+              f"{stats['rescans']} rescans); placement {stats['setup_seconds']:.2f}s, "
+              f"search {stats['search_seconds']:.2f}s, {stats['iterations_per_sec']:,.0f} iterations/sec")
+    else:
+        hill_climbing_n_queens(args.queens, vectorized=args.vectorized)
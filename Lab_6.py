@@ -1,14 +1,38 @@
+import argparse
+import csv
 import math
+import multiprocessing
+import os
 import random
+import time
+from array import array
+
+from Lab_5b import QueenCounters
+
+try:
+    import numpy as np
+except ImportError:  # only the batched annealer needs NumPy
+    np = None
 
 # Objective function: modify this for your problem
 def objective_function(x):
     return x**2  # Simple example: minimize x^2
 
-# Generate a neighbor solution near the current solution
-def get_neighbor(x):
-    step_size = random.uniform(-1, 1)  # small random change
-    return x + step_size
+# Rugged test objective (1-D Rastrigin): global minimum 0 at x = 0 and a
+# local minimum near every other integer, where a single cold chain sticks
+def rugged_objective(x):
+    return x**2 + 10 * (1 - math.cos(2 * math.pi * x))
+
+# Same landscape in as many dimensions as the solution list has entries
+def rastrigin(xs):
+    return sum(rugged_objective(x) for x in xs)
+
+# Generate a neighbor solution near the current solution; list solutions
+# move every coordinate
+def get_neighbor(x, step_size=1.0):
+    if isinstance(x, list):
+        return [xi + random.uniform(-step_size, step_size) for xi in x]
+    return x + random.uniform(-step_size, step_size)  # small random change
 
 # Acceptance probability function
 def acceptance_probability(current_cost, new_cost, temperature):
@@ -17,58 +41,594 @@ def acceptance_probability(current_cost, new_cost, temperature):
     else:
         return math.exp((current_cost - new_cost) / temperature)
 
+# Cooling schedules: each call gets (iteration, temperature, acceptance rate)
+# and returns the next temperature
+def exponential_cooling(initial_temp, alpha):
+    return lambda i, temperature, acceptance_rate: temperature * alpha
+
+# Slow T0 / log(i + 2) cooling, scaled so the first step keeps T0
+def logarithmic_cooling(initial_temp, alpha):
+    return lambda i, temperature, acceptance_rate: initial_temp * math.log(2) / math.log(i + 3)
+
+# Geometric cooling, reheated every period iterations to a shrinking
+# fraction of the initial temperature
+def reheating_cooling(initial_temp, alpha, period=200, fraction=0.5):
+    def schedule(i, temperature, acceptance_rate):
+        if (i + 1) % period == 0:
+            return initial_temp * fraction ** ((i + 1) // period)
+        return temperature * alpha
+    return schedule
+
+# Cool at alpha while more than target of the moves are accepted, and much
+# more slowly once the chain starts freezing
+def adaptive_cooling(initial_temp, alpha, target=0.3):
+    def schedule(i, temperature, acceptance_rate):
+        return temperature * (alpha if acceptance_rate > target else alpha ** 0.1)
+    return schedule
+
+SCHEDULES = {
+    "exponential": exponential_cooling,
+    "logarithmic": logarithmic_cooling,
+    "reheating": reheating_cooling,
+    "adaptive": adaptive_cooling,
+}
+
+ADAPT_INTERVAL = 50    # iterations between step size updates
+
+# Telemetry sampled every `every` iterations into preallocated float arrays,
+# one per field, so recording in the annealing loop is a few stores and no
+# formatting. Samples past the capacity are dropped.
+class AnnealingTrace:
+    FIELDS = ("iteration", "temperature", "current_cost", "best_cost", "acceptance")
+
+    def __init__(self, max_iterations, every=100):
+        self.every = every
+        self.capacity = max_iterations // every + 1
+        self.size = 0
+        self.columns = [array("d", bytes(8 * self.capacity)) for _ in self.FIELDS]
+
+    def record(self, iteration, temperature, current_cost, best_cost, acceptance):
+        k = self.size
+        if k < self.capacity:
+            iterations, temperatures, currents, bests, acceptances = self.columns
+            iterations[k] = iteration
+            temperatures[k] = temperature
+            currents[k] = current_cost
+            bests[k] = best_cost
+            acceptances[k] = acceptance
+            self.size = k + 1
+
+    def rows(self):
+        return zip(*(column[:self.size] for column in self.columns))
+
+    def to_numpy(self):
+        if np is None:
+            raise ImportError("AnnealingTrace.to_numpy needs NumPy")
+        return np.column_stack([np.frombuffer(column, dtype=np.float64)[:self.size] for column in self.columns])
+
+    def to_csv(self, path):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.FIELDS)
+            writer.writerows((int(row[0]),) + row[1:] for row in self.rows())
+
+    # .npy paths are saved with NumPy, anything else as CSV
+    def save(self, path):
+        if path.endswith(".npy"):
+            np.save(path, self.to_numpy())
+        else:
+            self.to_csv(path)
+
 # Simulated Annealing algorithm
-def simulated_annealing(initial_solution, initial_temp, final_temp, alpha, max_iterations):
+# schedule defaults to the original geometric cooling by alpha. With
+# target_acceptance set, the neighbor step size is tuned every
+# ADAPT_INTERVAL iterations toward that acceptance ratio. With patience
+# set, the search stops once the best cost has not improved by more than
+# tolerance for that many iterations. final_temp=None disables the
+# temperature cut-off. Progress goes to trace (an AnnealingTrace), if given.
+def simulated_annealing(initial_solution, initial_temp, final_temp, alpha, max_iterations,
+                        schedule=None, target_acceptance=None, patience=None, tolerance=0.0,
+                        objective=objective_function, trace=None):
+    if schedule is None:
+        schedule = exponential_cooling(initial_temp, alpha)
     current_solution = initial_solution
-    current_cost = objective_function(current_solution)
+    current_cost = objective(current_solution)
     best_solution = current_solution
     best_cost = current_cost
     temperature = initial_temp
+    step_size = 1.0
+    acceptance_rate = 1.0     # moving average over recent iterations
+    window_accepted = 0
+    last_improvement = 0
 
     for i in range(max_iterations):
         # Generate new candidate solution
-        new_solution = get_neighbor(current_solution)
-        new_cost = objective_function(new_solution)
+        new_solution = get_neighbor(current_solution, step_size)
+        new_cost = objective(new_solution)
 
         # Decide whether to accept the new solution
-        if random.random() < acceptance_probability(current_cost, new_cost, temperature):
+        accepted = random.random() < acceptance_probability(current_cost, new_cost, temperature)
+        if accepted:
             current_solution = new_solution
             current_cost = new_cost
+        acceptance_rate += 0.02 * (accepted - acceptance_rate)
 
         # Track the best solution found so far
         if new_cost < best_cost:
+            if best_cost - new_cost > tolerance:
+                last_improvement = i
             best_solution = new_solution
             best_cost = new_cost
 
+        # Widen the step while too many moves pass, narrow it while too few do
+        if target_acceptance is not None:
+            window_accepted += accepted
+            if (i + 1) % ADAPT_INTERVAL == 0:
+                step_size *= math.exp(window_accepted / ADAPT_INTERVAL - target_acceptance)
+                window_accepted = 0
+
         # Cool down the temperature
+        temperature = schedule(i, temperature, acceptance_rate)
+
+        # Sample progress
+        if trace is not None and i % trace.every == 0:
+            trace.record(i + 1, temperature, current_cost, best_cost, acceptance_rate)
+
+        if final_temp is not None and temperature < final_temp:
+            break
+        if patience is not None and i - last_improvement >= patience:
+            break
+
+    return best_solution, best_cost
+
+# Batched Simulated Annealing: K independent chains advanced in lockstep.
+# solutions has one row per chain; objective must map the whole batch to a
+# length-K cost array (objective_function already does for scalar chains).
+def simulated_annealing_batch(initial_solutions, initial_temp, final_temp, alpha, max_iterations,
+                              objective=objective_function, seed=None):
+    if np is None:
+        raise ImportError("simulated_annealing_batch needs NumPy")
+    rng = np.random.default_rng(seed)
+    current_solutions = np.array(initial_solutions, dtype=float)
+    current_costs = objective(current_solutions)
+    best_solutions = current_solutions.copy()
+    best_costs = current_costs.copy()
+    temperature = initial_temp
+    chains = len(current_solutions)
+
+    for i in range(max_iterations):
+        # Same uniform step as get_neighbor, drawn for every chain at once
+        new_solutions = current_solutions + rng.uniform(-1, 1, current_solutions.shape)
+        new_costs = objective(new_solutions)
+
+        # Downhill moves always pass, since exp of a positive number is > 1
+        accept = rng.random(chains) < np.exp(np.minimum(current_costs - new_costs, 0) / temperature)
+        current_solutions[accept] = new_solutions[accept]
+        current_costs[accept] = new_costs[accept]
+
+        improved = new_costs < best_costs
+        best_solutions[improved] = new_solutions[improved]
+        best_costs[improved] = new_costs[improved]
+
         temperature *= alpha
         if temperature < final_temp:
             break
 
-        # Optional: print progress
-        print(f"Iteration {i+1}: Temp={temperature:.4f}, Current={current_solution:.4f}, Best={best_solution:.4f}")
+    return best_solutions, best_costs
+
+# Combinatorial problems for anneal(). Each keeps its current cost and offers
+# propose_move(rng) -> move, delta_cost(move) -> cost change and apply(move),
+# so an iteration costs O(1) instead of a full re-evaluation, plus
+# solution() for a copy of the current state.
+
+# Travelling salesman over a closed tour; a move swaps two tour positions
+class TSPProblem:
+    def __init__(self, cities, tour=None):
+        self.cities = cities
+        self.tour = list(tour) if tour is not None else list(range(len(cities)))
+        n = len(self.tour)
+        self.cost = sum(self.edge(k) for k in range(n))
+
+    def edge(self, k):
+        (x1, y1), (x2, y2) = self.cities[self.tour[k]], self.cities[self.tour[(k + 1) % len(self.tour)]]
+        return math.hypot(x1 - x2, y1 - y2)
+
+    def propose_move(self, rng):
+        n = len(self.tour)
+        return rng.randrange(n), rng.randrange(n)
+
+    def delta_cost(self, move):
+        i, j = move
+        if i == j:
+            return 0.0
+        n = len(self.tour)
+        # Only the (at most four) edges touching positions i and j change
+        edges = {(i - 1) % n, i, (j - 1) % n, j}
+        before = sum(self.edge(k) for k in edges)
+        self.tour[i], self.tour[j] = self.tour[j], self.tour[i]
+        after = sum(self.edge(k) for k in edges)
+        self.tour[i], self.tour[j] = self.tour[j], self.tour[i]
+        return after - before
+
+    def apply(self, move):
+        i, j = move
+        self.cost += self.delta_cost(move)
+        self.tour[i], self.tour[j] = self.tour[j], self.tour[i]
+
+    def solution(self):
+        return list(self.tour)
 
+# N-Queens on the Lab_5b counters; a move puts one column's queen on a new row
+class NQueensProblem:
+    def __init__(self, state):
+        self.board = QueenCounters(state)
+
+    @property
+    def cost(self):
+        return self.board.conflicts
+
+    def propose_move(self, rng):
+        n = self.board.n
+        col = rng.randrange(n)
+        row = rng.randrange(n - 1)
+        return col, row if row < self.board.state[col] else row + 1    # never the current row
+
+    def delta_cost(self, move):
+        return self.board.delta(*move)
+
+    def apply(self, move):
+        self.board.move(*move)
+
+    def solution(self):
+        return list(self.board.state)
+
+# Balanced two-way graph partitioning minimizing cut edges; a move swaps a
+# node from each side. gain[v] (external minus internal neighbors) is kept
+# up to date, so a swap is scored in O(1) and applied in O(degree).
+class GraphPartitionProblem:
+    def __init__(self, adjacency, side=None):
+        n = len(adjacency)
+        self.adjacency = [set(neighbors) for neighbors in adjacency]
+        self.side = list(side) if side is not None else [v % 2 for v in range(n)]
+        self.members = [[v for v in range(n) if self.side[v] == s] for s in (0, 1)]
+        self.position = [0] * n
+        for nodes in self.members:
+            for i, v in enumerate(nodes):
+                self.position[v] = i
+        self.gain = [sum(1 if self.side[u] != self.side[v] else -1 for u in self.adjacency[v])
+                     for v in range(n)]
+        self.cost = sum(1 for v in range(n) for u in self.adjacency[v] if u > v and self.side[u] != self.side[v])
+
+    def propose_move(self, rng):
+        return rng.choice(self.members[0]), rng.choice(self.members[1])
+
+    def delta_cost(self, move):
+        u, v = move
+        # Swapping u and v keeps the u-v edge cut either way
+        shared = 2 if v in self.adjacency[u] else 0
+        return shared - self.gain[u] - self.gain[v]
+
+    def apply(self, move):
+        u, v = move
+        self.cost += self.delta_cost(move)
+        for node in (u, v):
+            old = self.side[node]
+            self.side[node] = 1 - old
+            self.gain[node] = -self.gain[node]
+            for neighbor in self.adjacency[node]:
+                # node joined neighbor's side or left it
+                self.gain[neighbor] += -2 if self.side[neighbor] == self.side[node] else 2
+        self.members[0][self.position[u]] = v
+        self.members[1][self.position[v]] = u
+        self.position[u], self.position[v] = self.position[v], self.position[u]
+
+    def solution(self):
+        return list(self.side)
+
+# Simulated annealing over a problem object: every iteration proposes one
+# move and only pays for its delta. The best state is copied only when the
+# search is about to step uphill away from it.
+def anneal(problem, initial_temp, final_temp, alpha, max_iterations,
+           schedule=None, patience=None, tolerance=0.0, seed=None, stats=None, trace=None):
+    rng = random.Random(seed)
+    if schedule is None:
+        schedule = exponential_cooling(initial_temp, alpha)
+    temperature = initial_temp
+    best_solution, best_cost = None, problem.cost
+    acceptance_rate = 1.0
+    last_improvement = 0
+    accepted_moves = 0
+
+    i = -1
+    for i in range(max_iterations):
+        move = problem.propose_move(rng)
+        delta = problem.delta_cost(move)
+        accepted = delta <= 0 or rng.random() < math.exp(-delta / temperature)
+        if accepted:
+            accepted_moves += 1
+            if delta > 0 and problem.cost == best_cost:
+                best_solution = problem.solution()
+            problem.apply(move)
+            if problem.cost < best_cost:
+                if best_cost - problem.cost > tolerance:
+                    last_improvement = i
+                best_cost = problem.cost
+                best_solution = None    # the current state is the best one
+        acceptance_rate += 0.02 * (accepted - acceptance_rate)
+
+        temperature = schedule(i, temperature, acceptance_rate)
+        if trace is not None and i % trace.every == 0:
+            trace.record(i + 1, temperature, problem.cost, best_cost, acceptance_rate)
+        if final_temp is not None and temperature < final_temp:
+            break
+        if patience is not None and i - last_improvement >= patience:
+            break
+
+    if best_solution is None:
+        best_solution = problem.solution()
+    if stats is not None:
+        stats.update(iterations=i + 1, accepted=accepted_moves)
+    return best_solution, best_cost
+
+# Random instances for the anneal() demo
+def random_problem(name, size, rng):
+    if name == "tsp":
+        return TSPProblem([(rng.random(), rng.random()) for _ in range(size)])
+    if name == "queens":
+        return NQueensProblem([rng.randrange(size) for _ in range(size)])
+    # Sparse random graph, about four neighbors per node
+    adjacency = [set() for _ in range(size)]
+    for _ in range(2 * size):
+        u, v = rng.randrange(size), rng.randrange(size)
+        if u != v:
+            adjacency[u].add(v)
+            adjacency[v].add(u)
+    return GraphPartitionProblem(adjacency)
+
+PROBLEMS = ("tsp", "queens", "partition")
+
+# Replica exchange (parallel tempering): one Metropolis chain per temperature
+# in worker processes, swapping states between neighboring temperatures
+# every exchange_interval steps so cold chains can escape local minima
+def temperature_ladder(low, high, replicas):
+    if replicas == 1:
+        return [low]
+    return [low * (high / low) ** (i / (replicas - 1)) for i in range(replicas)]
+
+# A contiguous slice of the ladder, owned by one worker for the whole run.
+# Each round it applies the swaps decided by the coordinator, runs steps
+# Metropolis moves per replica and reports every cost, but only the states
+# at its two ends, the only ones another worker can swap with.
+class TemperingSlice:
+    def __init__(self, temperatures, initial_solution, objective, seed):
+        self.temperatures = temperatures
+        self.objective = objective
+        self.rng = random.Random(seed)
+        self.solutions = [initial_solution] * len(temperatures)
+        self.costs = [objective(initial_solution)] * len(temperatures)
+        self.best_solution, self.best_cost = initial_solution, self.costs[0]
+
+    # swaps: (i, i + 1) local pairs to exchange; updates: {i: (solution,
+    # cost)} states handed over from a neighboring slice
+    def sweep(self, steps, swaps, updates):
+        solutions, costs, rng, objective = self.solutions, self.costs, self.rng, self.objective
+        for i, j in swaps:
+            solutions[i], solutions[j] = solutions[j], solutions[i]
+            costs[i], costs[j] = costs[j], costs[i]
+        for i, (solution, cost) in updates.items():
+            solutions[i], costs[i] = solution, cost
+        accepted = [0] * len(solutions)
+        for i, temperature in enumerate(self.temperatures):
+            solution, cost = solutions[i], costs[i]
+            for _ in range(steps):
+                new_solution = solution + rng.uniform(-1, 1)
+                new_cost = objective(new_solution)
+                if new_cost < cost or rng.random() < math.exp((cost - new_cost) / temperature):
+                    solution, cost = new_solution, new_cost
+                    accepted[i] += 1
+                    if cost < self.best_cost:
+                        self.best_solution, self.best_cost = solution, cost
+            solutions[i], costs[i] = solution, cost
+        return costs, solutions[0], solutions[-1], accepted, (self.best_solution, self.best_cost)
+
+def tempering_worker(connection, temperatures, initial_solution, objective, seed):
+    part = TemperingSlice(temperatures, initial_solution, objective, seed)
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        connection.send(part.sweep(*message))
+    connection.close()
+
+def parallel_tempering(initial_solution, temperatures, rounds, exchange_interval,
+                       objective=objective_function, workers=None, seed=None, stats=None):
+    rng = random.Random(seed)
+    replicas = len(temperatures)
+    workers = max(1, min(replicas, workers or os.cpu_count() or 1))
+    # Contiguous slices of the ladder: bounds[w] is worker w's first replica
+    bounds = [replicas * w // workers for w in range(workers + 1)]
+    owner = [w for w in range(workers) for _ in range(bounds[w], bounds[w + 1])]
+    accepted = [0] * replicas
+    swap_attempts = [0] * (replicas - 1)
+    swaps = [0] * (replicas - 1)
+    best_solution, best_cost = initial_solution, objective(initial_solution)
+
+    # A single slice runs in this process; otherwise each slice lives in
+    # its own process and only messages cross between them
+    if workers == 1:
+        parts = [TemperingSlice(temperatures, initial_solution, objective, rng.getrandbits(64))]
+    else:
+        parts, processes = [], []
+        for w in range(workers):
+            here, there = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=tempering_worker,
+                args=(there, temperatures[bounds[w]:bounds[w + 1]], initial_solution, objective, rng.getrandbits(64)),
+                daemon=True)
+            process.start()
+            there.close()    # so recv fails instead of hanging if the worker dies
+            parts.append(here)
+            processes.append(process)
+
+    messages = [([], {}) for _ in range(workers)]
+    try:
+        for r in range(rounds):
+            if workers == 1:
+                replies = [parts[0].sweep(exchange_interval, *messages[0])]
+            else:
+                for part, (local_swaps, updates) in zip(parts, messages):
+                    part.send((exchange_interval, local_swaps, updates))
+                replies = [part.recv() for part in parts]
+
+            costs = []
+            for w, (slice_costs, first, last, slice_accepted, (slice_best, slice_best_cost)) in enumerate(replies):
+                costs.extend(slice_costs)
+                for i, count in enumerate(slice_accepted):
+                    accepted[bounds[w] + i] += count
+                if slice_best_cost < best_cost:
+                    best_solution, best_cost = slice_best, slice_best_cost
+
+            # Alternate even and odd neighbor pairs so every pair gets a turn;
+            # the pairs are disjoint, so the swaps can be applied in any order
+            messages = [([], {}) for _ in range(workers)]
+            for i in range(r % 2, replicas - 1, 2):
+                swap_attempts[i] += 1
+                exponent = (1 / temperatures[i] - 1 / temperatures[i + 1]) * (costs[i] - costs[i + 1])
+                if exponent >= 0 or rng.random() < math.exp(exponent):
+                    swaps[i] += 1
+                    a, b = owner[i], owner[i + 1]
+                    if a == b:
+                        messages[a][0].append((i - bounds[a], i + 1 - bounds[a]))
+                    else:
+                        # i ends slice a and i + 1 starts slice b
+                        messages[a][1][i - bounds[a]] = (replies[b][1], costs[i + 1])
+                        messages[b][1][0] = (replies[a][2], costs[i])
+    finally:
+        if workers > 1:
+            for part in parts:
+                try:
+                    part.send(None)
+                except OSError:    # that worker already died
+                    pass
+            for process in processes:
+                process.join()
+
+    if stats is not None:
+        stats.update(
+            acceptance_rates=[a / (rounds * exchange_interval) for a in accepted],
+            swap_rates=[s / a if a else 0.0 for s, a in zip(swaps, swap_attempts)],
+        )
     return best_solution, best_cost
 
 # -------------------------
 # Run the Simulated Annealing
 # -------------------------
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulated annealing")
+    parser.add_argument("--chains", type=int, metavar="K", help="run K chains in lockstep with NumPy instead of the demo")
+    parser.add_argument("--problem", choices=PROBLEMS, help="anneal a random combinatorial instance instead of the demo")
+    parser.add_argument("--size", type=int, default=100, help="cities, queens or graph nodes for --problem")
+    parser.add_argument("--iterations", type=int, default=200000, help="annealing iterations for --problem")
+    parser.add_argument("--tempering", type=int, metavar="REPLICAS", help="run replica exchange on the rugged objective instead of the demo")
+    parser.add_argument("--rounds", type=int, default=200)
+    parser.add_argument("--interval", type=int, default=100, help="Metropolis steps per replica between swaps")
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--schedule", choices=SCHEDULES, default="exponential")
+    parser.add_argument("--target-acceptance", type=float, help="tune the step size toward this acceptance ratio")
+    parser.add_argument("--patience", type=int, help="stop after this many iterations without a better solution")
+    parser.add_argument("--trace-every", type=int, default=50, help="iterations between telemetry samples")
+    parser.add_argument("--trace", metavar="FILE", help="save the telemetry as CSV, or NumPy for .npy")
+    args = parser.parse_args()
+
     initial_solution = 10          # starting point
     initial_temp = 100             # initial temperature
     final_temp = 0.001             # stopping temperature
     alpha = 0.95                   # cooling rate
     max_iterations = 500           # max steps
 
-    best_solution, best_cost = simulated_annealing(
-        initial_solution,
-        initial_temp,
-        final_temp,
-        alpha,
-        max_iterations
-    )
-
-    print("\n==============================")
-    print(f"Best solution found: {best_solution}")
-    print(f"Best cost: {best_cost}")
-    print("==============================")
+    if args.problem:
+        problem = random_problem(args.problem, args.size, random.Random(args.seed))
+        initial_cost = problem.cost
+        stats = {}
+        trace = AnnealingTrace(args.iterations, args.trace_every)
+        start = time.perf_counter()
+        best_solution, best_cost = anneal(
+            problem,
+            initial_temp=1.0,
+            final_temp=None,
+            alpha=1 - 5 / args.iterations,
+            max_iterations=args.iterations,
+            schedule=SCHEDULES[args.schedule](1.0, 1 - 5 / args.iterations),
+            patience=args.patience,
+            seed=args.seed,
+            stats=stats,
+            trace=trace
+        )
+        elapsed = time.perf_counter() - start
+        print(f"{args.problem} ({args.size}): cost {initial_cost:.4f} -> {best_cost:.4f} "
+              f"in {stats['iterations']} iterations, {elapsed:.2f}s, {stats['iterations'] / elapsed:,.0f} iterations/sec")
+        if args.trace:
+            trace.save(args.trace)
+    elif args.tempering:
+        stats = {}
+        temperatures = temperature_ladder(0.1, 50, args.tempering)
+        start = time.perf_counter()
+        best_solution, best_cost = parallel_tempering(
+            initial_solution,
+            temperatures,
+            args.rounds,
+            args.interval,
+            objective=rugged_objective,
+            workers=args.workers,
+            seed=args.seed,
+            stats=stats
+        )
+        elapsed = time.perf_counter() - start
+        print(f"{args.tempering} replicas, {args.rounds} rounds in {elapsed:.2f}s")
+        for i, temperature in enumerate(temperatures):
+            swap = f", swap with next {stats['swap_rates'][i]:.2f}" if i < len(temperatures) - 1 else ""
+            print(f"T={temperature:8.3f}: acceptance {stats['acceptance_rates'][i]:.2f}{swap}")
+        print(f"Best solution found: {best_solution}")
+        print(f"Best cost: {best_cost}")
+    elif args.chains:
+        start = time.perf_counter()
+        best_solutions, best_costs = simulated_annealing_batch(
+            np.full(args.chains, initial_solution, dtype=float),
+            initial_temp,
+            final_temp,
+            alpha,
+            max_iterations,
+            seed=args.seed
+        )
+        elapsed = time.perf_counter() - start
+        best = int(np.argmin(best_costs))
+        print(f"{args.chains} chains annealed in {elapsed:.2f}s")
+        print(f"Best solution found: {best_solutions[best]}")
+        print(f"Best cost: {best_costs[best]}")
+        print(f"Median best cost: {np.median(best_costs)}")
+    else:
+        trace = AnnealingTrace(max_iterations, args.trace_every)
+        best_solution, best_cost = simulated_annealing(
+            initial_solution,
+            initial_temp,
+            final_temp,
+            alpha,
+            max_iterations,
+            schedule=SCHEDULES[args.schedule](initial_temp, alpha),
+            target_acceptance=args.target_acceptance,
+            patience=args.patience,
+            trace=trace
+        )
+
+        # Progress is printed from the trace after the run
+        for iteration, temperature, current_cost, best_cost_so_far, acceptance in trace.rows():
+            print(f"Iteration {iteration:.0f}: Temp={temperature:.4f}, Current cost={current_cost:.6f}, "
+                  f"Best cost={best_cost_so_far:.6f}, Acceptance={acceptance:.2f}")
+        if args.trace:
+            trace.save(args.trace)
+
+        print("\n==============================")
+        print(f"Best solution found: {best_solution}")
+        print(f"Best cost: {best_cost}")
+        print("==============================")
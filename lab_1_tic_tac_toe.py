@@ -1,15 +1,341 @@
-print('tic_tac_toe')
-board={1:' ',2:' ',3:' ',
-      4:' ',5:' ',6:' ',
-      7:' ',8:' ',9:' '
-}
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+# Board geometry: ROWS x COLS board, K in a row wins (m,n,k-game).
+# 3,3,3 is classic tic-tac-toe; try 4,4,4 or 7,7,5 for larger games.
+ROWS = 3
+COLS = 3
+K = 3
+
+# Per-move thinking time for the bot, in seconds
+TIME_LIMIT = 1.0
+
+# Larger than any heuristic score, so proven wins always dominate
+WIN_SCORE = 10 ** 9
+
+# Transposition table bound flags
+EXACT, LOWER, UPPER = 0, 1, 2
+
+def newBoard(rows, cols):
+   return {pos: ' ' for pos in range(1, rows * cols + 1)}
+
+def winLines(rows, cols, k):
+   # Every horizontal, vertical and diagonal run of k cells on the board
+   lines = []
+   for r in range(rows):
+       for c in range(cols):
+           for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+               endR, endC = r + dr * (k - 1), c + dc * (k - 1)
+               if 0 <= endR < rows and 0 <= endC < cols:
+                   lines.append([(r + dr * i) * cols + (c + dc * i) + 1 for i in range(k)])
+   return lines
+
+def boardSymmetries(rows, cols):
+   # The symmetries of the board (rotations, each optionally mirrored) as
+   # lists of cells read in symmetric order. A square board has 8,
+   # a rectangular one only the 4 that map it onto itself.
+   symmetries = []
+   for mirror in (False, True):
+       for turns in range(4):
+           order = []
+           for cell in range(rows * cols):
+               r, c = divmod(cell, cols)
+               h, w = rows, cols
+               if mirror:
+                   c = w - 1 - c
+               for _ in range(turns):
+                   r, c = c, h - 1 - r
+                   h, w = w, h
+               order.append(r * w + c)
+           if (h, w) == (rows, cols):
+               symmetries.append(order)
+   return symmetries
+
+def byteTables(order, cells):
+   # For each byte of a bitboard and each of its 256 values, the bits it
+   # maps to under this symmetry, so a whole board permutes in cells/8 lookups
+   index = {cell: i for i, cell in enumerate(order)}
+   tables = []
+   for start in range(0, cells, 8):
+       table = []
+       for value in range(256):
+           bits = 0
+           for b in range(8):
+               if value >> b & 1 and start + b < cells:
+                   bits |= 1 << index[start + b]
+           table.append(bits)
+       tables.append(table)
+   return tables
+
+def permute(bits, tables):
+   result = 0
+   for table in tables:
+       result |= table[bits & 0xFF]
+       bits >>= 8
+   return result
+
+class SearchTimeout(Exception):
+   pass
+
+class TicTacToeEngine:
+   # Headless m,n,k engine. All search state (transposition table, deadline,
+   # node counter) lives on the instance, so separate engines can run side by
+   # side, and one engine's table is reused across every position it sees.
+   #
+   # A state is a board dict {position: 'X' | 'O' | ' '} as used by the
+   # interactive game, or any sequence of those letters in position order.
+   # X moves first, so the side to move follows from the stone counts.
+
+   def __init__(self, rows=ROWS, cols=COLS, k=K, timeLimit=TIME_LIMIT):
+       self.rows, self.cols, self.k = rows, cols, k
+       self.timeLimit = timeLimit
+       self.cells = rows * cols
+       # Bitboards: each side's stones are one integer, bit pos-1 set for a
+       # stone on position pos. Lines become masks, so a win test is one AND.
+       self.fullMask = (1 << self.cells) - 1
+       self.lineMasks = [sum(1 << (pos - 1) for pos in line) for line in winLines(rows, cols, k)]
+       # Masks of the lines through each cell: after a move only these can complete
+       self.cellLines = [[mask for mask in self.lineMasks if mask >> cell & 1]
+                         for cell in range(self.cells)]
+       self.symmetries = boardSymmetries(rows, cols)
+       self.symmetryIndex = [{cell: i for i, cell in enumerate(order)} for order in self.symmetries]
+       self.symmetryTables = [byteTables(order, self.cells) for order in self.symmetries]
+       # Cells sorted by distance from the centre: central cells take part in
+       # the most lines, so trying them first gives alpha-beta earlier cutoffs.
+       self.centerOrder = sorted(range(self.cells), key=lambda cell: abs(cell // cols - (rows - 1) / 2)
+                                                                 + abs(cell % cols - (cols - 1) / 2))
+       # (canonical position key, X to move) ->
+       # (searched depth, bound flag, score, best move in canonical order)
+       self.transpositionTable = {}
+       self.deadline = 0.0
+       self.nodesSearched = 0
+
+   def bitboards(self, state):
+       if isinstance(state, dict):
+           letters = [state[pos] for pos in range(1, self.cells + 1)]
+       else:
+           letters = state
+       xs = os_ = 0
+       for cell, letter in enumerate(letters):
+           if letter == 'X':
+               xs |= 1 << cell
+           elif letter == 'O':
+               os_ |= 1 << cell
+       return xs, os_
+
+   def winsWith(self, bits, cell):
+       # Did the stone just placed on cell complete a line?
+       for mask in self.cellLines[cell]:
+           if bits & mask == mask:
+               return True
+       return False
+
+   def hasWon(self, bits):
+       for mask in self.lineMasks:
+           if bits & mask == mask:
+               return True
+       return False
+
+   def winner(self, state):
+       xs, os_ = self.bitboards(state)
+       if self.hasWon(xs):
+           return 'X'
+       if self.hasWon(os_):
+           return 'O'
+       return None
+
+   def isFull(self, state):
+       xs, os_ = self.bitboards(state)
+       return xs | os_ == self.fullMask
+
+   def boardKey(self, xs, os_):
+       # Both bitboards packed into one integer, minimised over all symmetries
+       # so that mirrored and rotated positions share one table entry. Also
+       # returns the symmetry used, to translate stored moves back.
+       key, keySymmetry = None, 0
+       for s, tables in enumerate(self.symmetryTables):
+           code = permute(xs, tables) << self.cells | permute(os_, tables)
+           if key is None or code < key:
+               key, keySymmetry = code, s
+       return key, keySymmetry
+
+   def orderedMoves(self, occupied, firstMove=None):
+       moves = [cell for cell in self.centerOrder if not occupied >> cell & 1 and cell != firstMove]
+       if firstMove is not None and not occupied >> firstMove & 1:
+           moves.insert(0, firstMove)
+       return moves
+
+   def evaluate(self, xs, os_):
+       # Heuristic for positions cut off by the depth limit, from X's side:
+       # every line still open to one side only counts for that side, more so
+       # the fuller it is.
+       score = 0
+       for mask in self.lineMasks:
+           x = xs & mask
+           o = os_ & mask
+           if x and not o:
+               score += 10 ** x.bit_count()
+           elif o and not x:
+               score -= 10 ** o.bit_count()
+       return score
+
+   def expand(self, xs, os_, depth, alpha, beta, xToMove, firstMove=None):
+       # Try every move, X maximising and O minimising; returns (score, move)
+       occupied = xs | os_
+       bestMove = None
+       if xToMove:
+           bestScore = -WIN_SCORE - 1
+           for cell in self.orderedMoves(occupied, firstMove):
+               after = xs | 1 << cell
+               if self.winsWith(after, cell):
+                   score = WIN_SCORE
+               else:
+                   score = self.alphabeta(after, os_, depth - 1, alpha, beta, False)
+               if (score > bestScore):
+                   bestScore = score
+                   bestMove = cell
+               alpha = max(alpha, score)
+               if alpha >= beta:
+                   break
+       else:
+           bestScore = WIN_SCORE + 1
+           for cell in self.orderedMoves(occupied, firstMove):
+               after = os_ | 1 << cell
+               if self.winsWith(after, cell):
+                   score = -WIN_SCORE
+               else:
+                   score = self.alphabeta(xs, after, depth - 1, alpha, beta, True)
+               if (score < bestScore):
+                   bestScore = score
+                   bestMove = cell
+               beta = min(beta, score)
+               if alpha >= beta:
+                   break
+       return bestScore, bestMove
+
+   def alphabeta(self, xs, os_, depth, alpha, beta, xToMove):
+       # The move that led here has already been checked for a win by the
+       # caller, so only the draw and depth cutoffs remain.
+       self.nodesSearched += 1
+       if self.nodesSearched % 128 == 0 and time.monotonic() > self.deadline:
+           raise SearchTimeout()
+
+       if xs | os_ == self.fullMask:
+           return 0
+       if depth == 0:
+           return self.evaluate(xs, os_)
+
+       key, symmetry = self.boardKey(xs, os_)
+       key = (key, xToMove)
+       ttMove = None
+       entry = self.transpositionTable.get(key)
+       if entry is not None:
+           entryDepth, flag, entryScore, canonicalMove = entry
+           ttMove = self.symmetries[symmetry][canonicalMove]
+           if entryDepth >= depth:
+               if flag == EXACT:
+                   return entryScore
+               if flag == LOWER and entryScore >= beta:
+                   return entryScore
+               if flag == UPPER and entryScore <= alpha:
+                   return entryScore
+
+       bestScore, bestMove = self.expand(xs, os_, depth, alpha, beta, xToMove, ttMove)
+
+       if bestScore <= alpha:
+           flag = UPPER
+       elif bestScore >= beta:
+           flag = LOWER
+       else:
+           flag = EXACT
+       self.transpositionTable[key] = (depth, flag, bestScore, self.symmetryIndex[symmetry][bestMove])
+       return bestScore
+
+   def search(self, state):
+       # Iterative deepening: search depth 1, 2, ... until the time budget runs
+       # out, keeping the best move of the deepest completed iteration. Each
+       # iteration seeds move ordering for the next through the table.
+       # Returns (position, score); the score is from X's point of view.
+       xs, os_ = self.bitboards(state)
+       moves = self.orderedMoves(xs | os_)
+       if not moves or self.hasWon(xs) or self.hasWon(os_):
+           raise ValueError('game is already over')
+       xToMove = xs.bit_count() == os_.bit_count()
+       self.deadline = time.monotonic() + self.timeLimit
+       bestMove, bestScore = moves[0], 0
+
+       for depth in range(1, len(moves) + 1):
+           try:
+               score, move = self.expand(xs, os_, depth, -WIN_SCORE - 1, WIN_SCORE + 1,
+                                         xToMove, bestMove)
+           except SearchTimeout:
+               break
+           bestMove, bestScore = move, score
+           if abs(score) == WIN_SCORE:
+               break
+       return bestMove + 1, bestScore
+
+   def best_move(self, state):
+       return self.search(state)[0]
+
+   def evaluate_batch(self, states):
+       # One (position, score) per state; the shared table makes positions
+       # that repeat or mirror each other across the batch nearly free.
+       return [self.search(state) for state in states]
+
+# ----------------- Self-play -----------------
+def playGames(task):
+   # Worker: plays a slice of the games with its own engine, so the
+   # transposition table warms up across that worker's games.
+   rows, cols, k, timeLimit, openingMoves, seeds = task
+   engine = TicTacToeEngine(rows, cols, k, timeLimit)
+   results = {'X': 0, 'O': 0, 'Draw': 0}
+   for seed in seeds:
+       rng = random.Random(seed)
+       state = [' '] * (rows * cols)
+       letter = 'X'
+       plies = 0
+       while True:
+           if plies < openingMoves:
+               # Random openings so that games between identical engines differ
+               pos = rng.choice([i + 1 for i, cell in enumerate(state) if cell == ' '])
+           else:
+               pos = engine.best_move(state)
+           state[pos - 1] = letter
+           plies += 1
+           bits = engine.bitboards(state)[0 if letter == 'X' else 1]
+           if engine.winsWith(bits, pos - 1):
+               results[letter] += 1
+               break
+           if plies == rows * cols:
+               results['Draw'] += 1
+               break
+           letter = 'O' if letter == 'X' else 'X'
+   return results
+
+def selfPlay(games, workers=None, rows=ROWS, cols=COLS, k=K, timeLimit=TIME_LIMIT, openingMoves=2):
+   # Spread games over a process pool; returns (results, games per second)
+   workers = workers or os.cpu_count() or 1
+   tasks = [(rows, cols, k, timeLimit, openingMoves, range(w, games, workers)) for w in range(workers)]
+   totals = {'X': 0, 'O': 0, 'Draw': 0}
+   start = time.perf_counter()
+   with ProcessPoolExecutor(max_workers=workers) as pool:
+       for results in pool.map(playGames, tasks):
+           for outcome, count in results.items():
+               totals[outcome] += count
+   gamesPerSecond = games / (time.perf_counter() - start)
+   return totals, gamesPerSecond
+
+# ----------------- Interactive game -----------------
 def printBoard(board):
-   print(board[1]+'|'+board[2]+'|'+board[3])
-   print('-+-+-')
-   print(board[4] + '|' + board[5] + '|' + board[6])
-   print('-+-+-')
-   print(board[7] + '|' + board[8] + '|' + board[9])
+   rows, cols = engine.rows, engine.cols
+   for r in range(rows):
+       print('|'.join(board[r * cols + c + 1] for c in range(cols)))
+       if r < rows - 1:
+           print('+'.join('-' * cols))
    print('\n')
 
 
@@ -20,62 +346,25 @@ def spaceFree(pos):
        return False
 
 def checkWin():
-   if(board[1]==board[2] and board[1]==board[3] and board[1]!=' '):
-       return True
-   elif(board[4]==board[5] and board[4]==board[6] and board[4]!=' '):
-       return True
-   elif(board[7]==board[8] and board[7]==board[9] and board[7]!=' '):
-       return True
-   elif (board[1] == board[5] and board[1] == board[9] and board[1] != ' '):
-       return True
-   elif (board[3] == board[5] and board[3] == board[7] and board[3] != ' '):
-       return True
-   elif (board[1] == board[4] and board[1] == board[7] and board[1] != ' '):
-       return True
-   elif (board[2] == board[5] and board[2] == board[8] and board[2] != ' '):
-       return True
-   elif (board[3] == board[6] and board[3] == board[9] and board[3] != ' '):
-       return True
-   else:
-       return False
+   return engine.winner(board) is not None
 
 def checkMoveForWin(move):
-   if (board[1]==board[2] and board[1]==board[3] and board[1] ==move):
-       return True
-   elif (board[4]==board[5] and board[4]==board[6] and board[4] ==move):
-       return True
-   elif (board[7]==board[8] and board[7]==board[9] and board[7] ==move):
-       return True
-   elif (board[1]==board[5] and board[1]==board[9] and board[1] ==move):
-       return True
-   elif (board[3]==board[5] and board[3]==board[7] and board[3] ==move):
-       return True
-   elif (board[1]==board[4] and board[1]==board[7] and board[1] ==move):
-       return True
-   elif (board[2]==board[5] and board[2]==board[8] and board[2] ==move):
-       return True
-   elif (board[3]==board[6] and board[3]==board[9] and board[3] ==move):
-       return True
-   else:
-       return False
+   return engine.winner(board) == move
 
 def checkDraw():
-   for key in board.keys():
-       if (board[key]==' '):
-           return False
-   return True
+   return engine.isFull(board)
 
 def insertLetter(letter, position):
    if (spaceFree(position)):
        board[position] = letter
        printBoard(board)
-       if (checkDraw()):
-           print('Draw!')
-       elif (checkWin()):
+       if (checkWin()):
            if (letter == 'X'):
                print('Bot wins!')
            else:
                print('You win!')
+       elif (checkDraw()):
+           print('Draw!')
        return
    else:
        print('Position taken, please pick a different position.')
@@ -92,48 +381,33 @@ def playerMove():
    return
 
 def compMove():
-   bestScore=-1000
-   bestMove=0
-   for key in board.keys():
-       if (board[key]==' '):
-           board[key]=bot
-           score = minimax(board, False)
-           board[key] = ' '
-           if (score > bestScore):
-               bestScore = score
-               bestMove = key
-   insertLetter(bot, bestMove)
+   insertLetter(bot, engine.best_move(board))
    return
 
-def minimax(board, isMaximizing):
-   if (checkMoveForWin(bot)):
-       return 1
-   elif (checkMoveForWin(player)):
-       return -1
-   elif (checkDraw()):
-       return 0
-
-   if isMaximizing:
-       bestScore = -1000
-       for key in board.keys():
-           if board[key] == ' ':
-               board[key] = bot
-               score = minimax(board, False)
-               board[key] = ' '
-               if (score > bestScore):
-                   bestScore = score
-       return bestScore
-   else:
-       bestScore = 1000
-       for key in board.keys():
-           if board[key] == ' ':
-               board[key] = player
-               score = minimax(board, True)
-               board[key] = ' '
-               if (score < bestScore):
-                   bestScore = score
-       return bestScore
+if __name__ == "__main__":
+   parser = argparse.ArgumentParser(description='m,n,k tic-tac-toe against the bot, or bot self-play')
+   parser.add_argument('--selfplay', type=int, metavar='GAMES', help='play GAMES bot-vs-bot games headlessly')
+   parser.add_argument('--workers', type=int, help='self-play worker processes (default: CPU count)')
+   parser.add_argument('--rows', type=int, default=ROWS, help='board rows')
+   parser.add_argument('--cols', type=int, default=COLS, help='board columns')
+   parser.add_argument('--k', type=int, default=K, help='stones in a row needed to win')
+   parser.add_argument('--time-limit', type=float, default=TIME_LIMIT, help='seconds per bot move')
+   args = parser.parse_args()
+   if min(args.rows, args.cols, args.k) < 1 or args.k > max(args.rows, args.cols):
+       parser.error('need rows, cols, k >= 1 and k <= max(rows, cols)')
 
-while not checkWin():
-   compMove()
-   playerMove()
\ No newline at end of file
+   if args.selfplay:
+       results, gamesPerSecond = selfPlay(args.selfplay, args.workers, args.rows, args.cols, args.k, args.time_limit)
+       print(f"X wins: {results['X']}, O wins: {results['O']}, Draws: {results['Draw']}")
+       print(f"{args.selfplay} games at {gamesPerSecond:.1f} games/sec")
+   else:
+       print('tic_tac_toe')
+       engine = TicTacToeEngine(args.rows, args.cols, args.k, args.time_limit)
+       board = newBoard(args.rows, args.cols)
+       while True:
+           compMove()
+           if checkWin() or checkDraw():
+               break
+           playerMove()
+           if checkWin() or checkDraw():
+               break